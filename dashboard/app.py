@@ -11,6 +11,8 @@ import folium.plugins
 from streamlit_folium import st_folium
 import altair as alt
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
 from pathlib import Path
 import logging
 
@@ -26,11 +28,27 @@ logger = logging.getLogger(__name__)
 
 
 @st.cache_data
-def load_parquet_data(parquet_path: str) -> pd.DataFrame:
-    """Load Parquet database from file"""
+def load_parquet_data(parquet_path: str, naics_codes: tuple = None) -> pd.DataFrame:
+    """
+    Load Parquet database from file
+    
+    Also accepts the naics_code-partitioned dataset directory written by
+    run_pipeline.py --partition-by-naics (same path without .parquet);
+    naics_codes then limits the read to those partitions.
+    """
     try:
-        df = pd.read_parquet(parquet_path)
-        st.success(f"Loaded {len(df)} records from {Path(parquet_path).name}")
+        path = Path(parquet_path)
+        if not path.exists() and path.with_suffix('').is_dir():
+            path = path.with_suffix('')
+        
+        if path.is_dir():
+            # Keep partition values as text (hive inference would make them ints)
+            partitioning = ds.partitioning(pa.schema([('naics_code', pa.string())]), flavor='hive')
+            filters = [('naics_code', 'in', list(naics_codes))] if naics_codes else None
+            df = pd.read_parquet(path, partitioning=partitioning, filters=filters)
+        else:
+            df = pd.read_parquet(path)
+        st.success(f"Loaded {len(df)} records from {path.name}")
         return df
     except FileNotFoundError:
         st.error(f"Parquet file not found: {parquet_path}")
@@ -40,6 +58,23 @@ def load_parquet_data(parquet_path: str) -> pd.DataFrame:
         return None
 
 
+def naics_partitions(parquet_path: str) -> list:
+    """
+    NAICS codes of a naics_code-partitioned dataset next to parquet_path
+    
+    Returns:
+        Sorted partition values, or an empty list for a single Parquet file
+    """
+    path = Path(parquet_path)
+    if path.exists() or not path.with_suffix('').is_dir():
+        return []
+    prefix = 'naics_code='
+    return sorted(
+        child.name[len(prefix):] for child in path.with_suffix('').iterdir()
+        if child.is_dir() and child.name.startswith(prefix)
+    )
+
+
 @st.cache_data
 def create_gdf(df: pd.DataFrame) -> gpd.GeoDataFrame:
     """Convert DataFrame to GeoDataFrame"""
@@ -54,19 +89,24 @@ def create_gdf(df: pd.DataFrame) -> gpd.GeoDataFrame:
     return gdf
 
 
-def sidebar_filters(df: pd.DataFrame) -> dict:
+def sidebar_filters(df: pd.DataFrame, naics_codes: tuple = None) -> dict:
     """
     Create sidebar filters
     
+    Args:
+        df: Loaded records
+        naics_codes: NAICS selection already made before loading (partitioned
+            data); no NAICS widget is drawn when given
+    
     Returns:
         Dictionary of filter values
     """
-    st.sidebar.header("Filters")
-    
     filters = {}
     
     # NAICS code filter
-    if 'naics_code' in df.columns:
+    if naics_codes is not None:
+        filters['naics'] = list(naics_codes)
+    elif 'naics_code' in df.columns:
         unique_naics = df['naics_code'].dropna().unique()
         filters['naics'] = st.sidebar.multiselect(
             "NAICS Code",
@@ -337,13 +377,25 @@ def main():
     # Load data
     parquet_path = "data/processed/nets_enhanced_minneapolis.parquet"
     
-    df = load_parquet_data(parquet_path)
+    st.sidebar.header("Filters")
+    
+    # With partitioned data, pick NAICS codes first so only those partitions are read
+    naics_codes = None
+    partition_codes = naics_partitions(parquet_path)
+    if partition_codes:
+        naics_codes = tuple(st.sidebar.multiselect(
+            "NAICS Code",
+            options=partition_codes,
+            default=partition_codes
+        ))
+    
+    df = load_parquet_data(parquet_path, naics_codes)
     if df is None or df.empty:
         st.error("Unable to load data. Please check parquet file path.")
         return
     
     # Apply filters
-    filters = sidebar_filters(df)
+    filters = sidebar_filters(df, naics_codes)
     filtered_df = apply_filters(df, filters)
     
     st.info(f"Showing {len(filtered_df)} of {len(df)} establishments")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Convert the NETS test fixture CSV to a typed Parquet copy
+==========================================================
+--test runs prefer tests/fixtures/nets_test_data.parquet when it is at least
+as new as the CSV, so the fixture is not re-parsed on every run. Re-run this
+script after editing the CSV.
+
+Usage:
+    python scripts/convert_fixture.py
+    python scripts/convert_fixture.py --input path/to/fixture.csv
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+# Add project to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.nets_loader import NETSLoader
+
+DEFAULT_FIXTURE_CSV = PROJECT_ROOT / "tests" / "fixtures" / "nets_test_data.csv"
+
+
+def convert_fixture(csv_path: Path, parquet_path: Path = None) -> Path:
+    """
+    Write a ZSTD Parquet copy of a NETS CSV next to it
+
+    Args:
+        csv_path: NETS CSV file
+        parquet_path: Output path (default: same name with .parquet suffix)
+
+    Returns:
+        Path to the written Parquet file
+    """
+    parquet_path = parquet_path or csv_path.with_suffix('.parquet')
+    # Read with the loader so the Parquet schema carries the pipeline dtypes
+    df = NETSLoader(str(csv_path)).load_raw()
+    df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+    return parquet_path
+
+
+def main() -> int:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Convert the NETS test fixture CSV to Parquet")
+    parser.add_argument(
+        '--input', '-i',
+        type=Path,
+        default=DEFAULT_FIXTURE_CSV,
+        help='Fixture CSV to convert (default: tests/fixtures/nets_test_data.csv)'
+    )
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        print(f"Fixture CSV not found: {args.input}")
+        return 1
+
+    output = convert_fixture(args.input)
+    print(f"Wrote {output} ({output.stat().st_size / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,7 @@ This will print:
 """
 
 from pathlib import Path
+import stat
 import sys
 
 
@@ -139,51 +140,56 @@ TARGET_NAICS_CODES = {
 # MAIN: Print Documentation and Check Status
 # =============================================================================
 
-def print_separator(title: str = "") -> None:
-    """Print formatted section separator"""
-    print("\n" + "=" * 80)
+def format_separator(title: str = "") -> str:
+    """Formatted section separator"""
+    lines = ["\n" + "=" * 80]
     if title:
-        print(f"  {title}")
-        print("=" * 80)
-
-
-def print_path_status(path: Path, description: str) -> bool:
-    """Check and print file/directory status"""
-    exists = path.exists()
+        lines += [f"  {title}", "=" * 80]
+    return "\n".join(lines)
+
+
+def format_path_status(path: Path, description: str) -> str:
+    """File/directory status line"""
+    # A single stat() answers exists/is_file/size
+    try:
+        st = path.stat()
+    except OSError:
+        st = None
+    exists = st is not None
     status = "[OK]" if exists else "[--]"
     size_info = ""
-    if exists and path.is_file():
-        size_kb = path.stat().st_size / 1024
+    if exists and stat.S_ISREG(st.st_mode):
+        size_kb = st.st_size / 1024
         if size_kb > 1024:
             size_info = f" ({size_kb/1024:.1f} MB)"
         else:
             size_info = f" ({size_kb:.1f} KB)"
-    print(f"  {status} {path.relative_to(PROJECT_ROOT)}{size_info}")
-    print(f"       {description}")
-    return exists
+    return f"  {status} {path.relative_to(PROJECT_ROOT)}{size_info}\n       {description}"
 
 
-def print_columns(columns: dict, indent: int = 2) -> None:
-    """Print column schema with descriptions"""
+def format_columns(columns: dict, indent: int = 2) -> str:
+    """Column schema with descriptions"""
     prefix = " " * indent
-    for col, desc in columns.items():
-        print(f"{prefix}- {col:30s}: {desc}")
+    return "\n".join(f"{prefix}- {col:30s}: {desc}" for col, desc in columns.items())
 
 
 def main() -> int:
     """Main entry point - print documentation and check data status"""
     
-    print_separator("NETS ENHANCEMENT PIPELINE - DATA PATH REFERENCE")
-    print("\n  This script documents required data paths and CSV schema.")
-    print("  NO DATA GENERATION - you must provide your own NETS CSV files.")
+    # Sections are collected and written to stdout once
+    out = []
+    
+    out.append(format_separator("NETS ENHANCEMENT PIPELINE - DATA PATH REFERENCE"))
+    out.append("\n  This script documents required data paths and CSV schema.")
+    out.append("  NO DATA GENERATION - you must provide your own NETS CSV files.")
     
     # ==========================================================================
     # Section 1: Directory Structure
     # ==========================================================================
-    print_separator("DIRECTORY STRUCTURE")
+    out.append(format_separator("DIRECTORY STRUCTURE"))
     
-    print("\n  Required directory layout:")
-    print("""
+    out.append("\n  Required directory layout:")
+    out.append("""
     NETS-AI/
     +-- data/
     |   +-- raw/                    <- Place your NETS CSV files here
@@ -199,62 +205,61 @@ def main() -> int:
     # ==========================================================================
     # Section 2: Required Input Files
     # ==========================================================================
-    print_separator("REQUIRED INPUT FILES")
+    out.append(format_separator("REQUIRED INPUT FILES"))
     
-    print("\n  Production data (full NETS snapshot):")
-    print_path_status(NETS_INPUT_PATH, "Primary input file for Minneapolis pilot")
-    print_path_status(NETS_FULL_PATH, "Alternative: full dataset path")
+    out.append("\n  Production data (full NETS snapshot):")
+    out.append(format_path_status(NETS_INPUT_PATH, "Primary input file for Minneapolis pilot"))
+    out.append(format_path_status(NETS_FULL_PATH, "Alternative: full dataset path"))
     
-    print("\n  Test fixtures (small subset for development):")
-    print_path_status(TEST_FIXTURE_PATH, "5-20 records for --test mode")
+    out.append("\n  Test fixtures (small subset for development):")
+    out.append(format_path_status(TEST_FIXTURE_PATH, "5-20 records for --test mode"))
     
-    print("\n  Optional geographic data:")
-    print_path_status(CENSUS_TRACTS_PATH, "Census tract boundaries for spatial join")
+    out.append("\n  Optional geographic data:")
+    out.append(format_path_status(CENSUS_TRACTS_PATH, "Census tract boundaries for spatial join"))
     
     # ==========================================================================
     # Section 3: Required CSV Schema
     # ==========================================================================
-    print_separator("REQUIRED CSV COLUMNS (8 mandatory)")
-    print_columns(REQUIRED_COLUMNS)
+    out.append(format_separator("REQUIRED CSV COLUMNS (8 mandatory)"))
+    out.append(format_columns(REQUIRED_COLUMNS))
     
-    print_separator("OPTIONAL NETS COLUMNS (recommended)")
-    print_columns(OPTIONAL_NETS_COLUMNS)
+    out.append(format_separator("OPTIONAL NETS COLUMNS (recommended)"))
+    out.append(format_columns(OPTIONAL_NETS_COLUMNS))
     
-    print_separator("ENRICHMENT COLUMNS (added by pipeline)")
-    print_columns(OPTIONAL_ENRICHMENT_COLUMNS)
+    out.append(format_separator("ENRICHMENT COLUMNS (added by pipeline)"))
+    out.append(format_columns(OPTIONAL_ENRICHMENT_COLUMNS))
     
     # ==========================================================================
     # Section 4: Output Schema
     # ==========================================================================
-    print_separator("OUTPUT COLUMNS (generated by pipeline)")
-    print_columns(OUTPUT_COLUMNS)
+    out.append(format_separator("OUTPUT COLUMNS (generated by pipeline)"))
+    out.append(format_columns(OUTPUT_COLUMNS))
     
-    print("\n  Output format: Apache Parquet")
-    print(f"  Output path:   {DATA_PROCESSED_DIR.relative_to(PROJECT_ROOT)}/nets_enhanced_<city>_<timestamp>.parquet")
+    out.append("\n  Output format: Apache Parquet")
+    out.append(f"  Output path:   {DATA_PROCESSED_DIR.relative_to(PROJECT_ROOT)}/nets_enhanced_<city>_<timestamp>.parquet")
     
     # ==========================================================================
     # Section 5: NAICS Codes
     # ==========================================================================
-    print_separator("TARGET NAICS CODES")
-    for code, desc in TARGET_NAICS_CODES.items():
-        print(f"  - {code}: {desc}")
+    out.append(format_separator("TARGET NAICS CODES"))
+    out.extend(f"  - {code}: {desc}" for code, desc in TARGET_NAICS_CODES.items())
     
     # ==========================================================================
     # Section 6: Geographic Reference
     # ==========================================================================
-    print_separator("MINNEAPOLIS GEOGRAPHIC REFERENCE")
-    print(f"\n  Bounding Box (EPSG:4326):")
-    print(f"    Latitude:  {MINNEAPOLIS_BOUNDS['lat_min']:.4f} to {MINNEAPOLIS_BOUNDS['lat_max']:.4f}")
-    print(f"    Longitude: {MINNEAPOLIS_BOUNDS['lon_min']:.4f} to {MINNEAPOLIS_BOUNDS['lon_max']:.4f}")
-    print(f"\n  Target ZIP Codes:")
-    print(f"    {', '.join(MINNEAPOLIS_ZIP_CODES)}")
+    out.append(format_separator("MINNEAPOLIS GEOGRAPHIC REFERENCE"))
+    out.append(f"\n  Bounding Box (EPSG:4326):")
+    out.append(f"    Latitude:  {MINNEAPOLIS_BOUNDS['lat_min']:.4f} to {MINNEAPOLIS_BOUNDS['lat_max']:.4f}")
+    out.append(f"    Longitude: {MINNEAPOLIS_BOUNDS['lon_min']:.4f} to {MINNEAPOLIS_BOUNDS['lon_max']:.4f}")
+    out.append(f"\n  Target ZIP Codes:")
+    out.append(f"    {', '.join(MINNEAPOLIS_ZIP_CODES)}")
     
     # ==========================================================================
     # Section 7: Usage Instructions
     # ==========================================================================
-    print_separator("USAGE INSTRUCTIONS")
+    out.append(format_separator("USAGE INSTRUCTIONS"))
     
-    print("""
+    out.append("""
     1. PREPARE YOUR DATA:
        - Export NETS snapshot to CSV with required columns
        - Filter to NAICS codes 722513 and 446110
@@ -279,9 +284,11 @@ def main() -> int:
        - Dashboard: streamlit run dashboard/app.py
     """)
     
-    print_separator()
-    print("  Data path documentation complete.")
-    print("  Provide your NETS CSV files and run the pipeline.\n")
+    out.append(format_separator())
+    out.append("  Data path documentation complete.")
+    out.append("  Provide your NETS CSV files and run the pipeline.\n")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return 0
 
@@ -14,7 +14,6 @@ import traceback
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.data.pipeline import NETSDataPipeline
 from src.utils.logger import setup_logger
 
 logger = setup_logger("NETSPipelineRunner")
@@ -51,6 +50,12 @@ Examples:
         --input data/raw/nets.csv \\
         --skip gpt wayback linkedin
 
+    # Bound memory on very large inputs
+    python run_pipeline.py --input data/raw/nets.csv --chunksize 200000
+
+    # Faster CSV parsing for large inputs
+    python run_pipeline.py --input data/raw/nets.csv --fast-io
+
     # Custom NAICS codes
     python run_pipeline.py \\
         --input data/raw/nets.csv \\
@@ -76,7 +81,7 @@ Examples:
         '--input', '-i',
         type=str,
         default=None,
-        help='Path to input NETS CSV file (required unless using --test with test data)'
+        help='Path to input NETS CSV (or Parquet) file (required unless using --test with test data)'
     )
     
     parser.add_argument(
@@ -112,6 +117,70 @@ Examples:
         help='Enable verbose logging'
     )
     
+    parser.add_argument(
+        '--fast-io',
+        action='store_true',
+        help='Parse the input CSV with the PyArrow engine (faster on large NETS files)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the filtered-records Parquet cache in data/cache'
+    )
+    
+    parser.add_argument(
+        '--rebuild-cache',
+        action='store_true',
+        help='Re-read the CSV and overwrite the filtered-records cache'
+    )
+    
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Stream the input CSV in chunks of N rows to bound memory (optional)'
+    )
+    
+    parser.add_argument(
+        '--geo',
+        action='store_true',
+        help='Build the GeoDataFrame in Phase 2 (not used by later phases)'
+    )
+    
+    parser.add_argument(
+        '--compression',
+        choices=['zstd', 'snappy', 'gzip', 'none'],
+        default='zstd',
+        help='Parquet compression codec (default: zstd)'
+    )
+    
+    parser.add_argument(
+        '--compression-level',
+        type=int,
+        default=3,
+        help='Codec level for zstd/gzip (default: 3)'
+    )
+    
+    parser.add_argument(
+        '--partition-by-naics',
+        action='store_true',
+        help='Write a dataset directory partitioned by naics_code instead of one Parquet file'
+    )
+    
+    parser.add_argument(
+        '--schema-only',
+        action='store_true',
+        help='Export only PARQUET_OUTPUT_SCHEMA columns (drop model diagnostics and raw extras)'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for employee/survival estimation (-1 = all cores, default: 1)'
+    )
+    
     parser.add_argument(
         '--sample-size',
         type=int,
@@ -119,6 +188,22 @@ Examples:
         help='Limit to N records for testing (optional)'
     )
     
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Random seed for --sample-size record selection (default: 42)'
+    )
+    
+    parser.add_argument(
+        '--sample-strategy',
+        choices=['random', 'head'],
+        default=None,
+        help="How --sample-size picks records: 'random' draws N (seeded by --seed) "
+             "from every filtered record; 'head' keeps the first N matches and "
+             "stops reading there (default: head with --test, random otherwise)"
+    )
+    
     return parser
 
 
@@ -129,8 +214,8 @@ def validate_input(input_path: str) -> bool:
         if not path.exists():
             logger.error(f"Input file not found: {input_path}")
             return False
-        if path.suffix.lower() != '.csv':
-            logger.error(f"Input file must be CSV: {input_path}")
+        if path.suffix.lower() not in ('.csv', '.parquet'):
+            logger.error(f"Input file must be CSV or Parquet: {input_path}")
             return False
         logger.info(f"Input file validated: {input_path}")
         return True
@@ -146,6 +231,15 @@ def get_test_fixture_path() -> Path:
         Path("tests/fixtures/nets_test_fixture_small.csv"),  # Legacy support
     ]
     
+    # Typed Parquet copy (scripts/convert_fixture.py) skips CSV parsing, if
+    # it is at least as new as the CSV it was built from
+    parquet_path = test_paths[0].with_suffix('.parquet')
+    if parquet_path.exists() and (
+        not test_paths[0].exists()
+        or parquet_path.stat().st_mtime >= test_paths[0].stat().st_mtime
+    ):
+        return parquet_path
+    
     for test_path in test_paths:
         if test_path.exists():
             return test_path
@@ -164,7 +258,19 @@ def run_pipeline(
     validate: bool = False,
     sample_size: int = None,
     verbose: bool = False,
-    skip_operations: list = None
+    skip_operations: list = None,
+    fast_io: bool = False,
+    use_cache: bool = True,
+    rebuild_cache: bool = False,
+    chunksize: int = None,
+    seed: int = 42,
+    sample_strategy: str = 'random',
+    n_jobs: int = 1,
+    build_geodataframe: bool = False,
+    partition_by_naics: bool = False,
+    compression: str = 'zstd',
+    compression_level: int = 3,
+    schema_only: bool = False
 ) -> bool:
     """
     Run the NETS data enhancement pipeline
@@ -177,11 +283,25 @@ def run_pipeline(
         sample_size: Optional limit on records
         verbose: Enable verbose logging
         skip_operations: List of operations to skip (e.g., ['gpt', 'wayback'])
+        fast_io: Use the PyArrow CSV engine for loading
+        use_cache: Reuse filtered records cached as Parquet from a previous run
+        rebuild_cache: Refresh the filtered-records cache from the CSV
+        chunksize: Optional row count for streaming the CSV in chunks
+        seed: Random seed used when sampling records
+        sample_strategy: 'random' sample of all filtered records, or 'head'
+            (first N matches; loading stops there)
+        n_jobs: Worker processes for the model phases
+        build_geodataframe: Run Phase 2 and build Point geometries
+        partition_by_naics: Export a naics_code-partitioned Parquet dataset
+        compression: Parquet codec ('zstd', 'snappy', 'gzip' or 'none')
+        compression_level: Codec level for zstd/gzip
+        schema_only: Export only the PARQUET_OUTPUT_SCHEMA columns
     
     Returns:
         True if successful, False otherwise
     """
-    skip_operations = skip_operations or []
+    # Hashed once; each phase checks membership
+    skip_operations = frozenset(skip_operations or [])
     
     try:
         logger.info("="*70)
@@ -190,7 +310,7 @@ def run_pipeline(
         logger.info(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         if skip_operations:
-            logger.info(f"[SKIPPING]: {', '.join(skip_operations)}")
+            logger.info(f"[SKIPPING]: {', '.join(sorted(skip_operations))}")
         
         # Validate input
         if not validate_input(input_path):
@@ -201,32 +321,51 @@ def run_pipeline(
         output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Output directory: {output_dir}")
         
+        # Deferred so --help and bad input paths don't pay for geopandas/model imports
+        from src.data.pipeline import NETSDataPipeline
+        
         # Initialize pipeline
         logger.info(f"Initializing pipeline with NAICS codes: {naics_codes}")
         pipeline = NETSDataPipeline(
             nets_csv_path=input_path,
             output_parquet_path=output_path,
-            target_naics_codes=naics_codes
+            target_naics_codes=naics_codes,
+            fast_io=fast_io,
+            use_cache=use_cache,
+            rebuild_cache=rebuild_cache,
+            chunksize=chunksize,
+            n_jobs=n_jobs
         )
         
         # Load and filter data
         logger.info("\nPhase 1: Loading and filtering NETS data...")
-        df = pipeline.load_and_filter(filter_by_zip=True, filter_active_only=True)
+        # A head sample stops reading the CSV once enough matches are found;
+        # a random sample needs every match to draw from
+        df = pipeline.load_and_filter(
+            filter_by_zip=True,
+            filter_active_only=True,
+            max_records=sample_size if sample_strategy == 'head' else None
+        )
         logger.info(f"Records after filtering: {len(df)}")
         
         if df.empty:
             logger.error("No records found after filtering!")
             return False
         
-        # Apply sample size if specified
+        # Head samples were already cut to size while loading
         if sample_size and len(df) > sample_size:
-            logger.info(f"Limiting to sample size: {sample_size}")
-            df = df.sample(n=sample_size, random_state=42)
+            logger.info(f"Limiting to sample size: {sample_size} ({sample_strategy}, seed={seed})")
+            df = df.sample(n=sample_size, random_state=seed)
+            pipeline.df = df
+            pipeline.nets_loader.df = df
         
-        # Create geodataframe
-        logger.info("\nPhase 2: Creating geospatial data structure...")
-        gdf = pipeline.create_geodataframe()
-        logger.info(f"GeoDataFrame created with {len(gdf)} geometries")
+        # Create geodataframe (no later phase reads it, so only on request)
+        if build_geodataframe:
+            logger.info("\nPhase 2: Creating geospatial data structure...")
+            gdf = pipeline.create_geodataframe()
+            logger.info(f"GeoDataFrame created with {len(gdf)} geometries")
+        else:
+            logger.info("\nPhase 2: [SKIPPED] GeoDataFrame not needed by later phases (use --geo)")
         
         # Estimate employees (skip if requested)
         if 'employees' not in skip_operations:
@@ -259,10 +398,15 @@ def run_pipeline(
         
         # Prepare and export
         logger.info("\nPhase 6: Preparing Parquet output...")
-        df_output = pipeline.prepare_parquet_output()
+        df_output = pipeline.prepare_parquet_output(schema_only=schema_only)
         
         logger.info(f"Exporting to {output_path}...")
-        pipeline.export_parquet(df_output)
+        output_file = pipeline.export_parquet(
+            df_output,
+            compression=None if compression == 'none' else compression,
+            compression_level=compression_level,
+            partition_cols=['naics_code'] if partition_by_naics else None
+        )
         logger.info("[OK] Export completed successfully")
         
         # Validation
@@ -275,13 +419,23 @@ def run_pipeline(
                 logger.warning(f"Missing columns: {missing_cols}")
             else:
                 logger.info("[OK] All required columns present")
+            
+            # Check the written output from its footers instead of re-reading it
+            output_check = NETSValidator.check_parquet_output(output_file)
+            if output_check['total'] != len(df_output) or output_check['missing_columns']:
+                logger.warning(
+                    f"Parquet output mismatch: {output_check['total']} rows written, "
+                    f"missing columns: {output_check['missing_columns']}"
+                )
+            else:
+                logger.info(f"[OK] Parquet output verified: {output_check['total']} rows")
         
         # Summary statistics
         logger.info("\n" + "="*70)
         logger.info("PIPELINE EXECUTION SUMMARY")
         logger.info("="*70)
         logger.info(f"Total records processed: {len(df_output)}")
-        logger.info(f"Output file size: {Path(output_path).stat().st_size / 1024 / 1024:.2f} MB")
+        logger.info(f"Output file size: {pipeline.output_size_bytes / 1024 / 1024:.2f} MB")
         logger.info(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("="*70)
         
@@ -359,7 +513,19 @@ def main():
         validate=args.validate,
         sample_size=args.sample_size,
         verbose=args.verbose,
-        skip_operations=args.skip
+        skip_operations=args.skip,
+        fast_io=args.fast_io,
+        use_cache=not args.no_cache,
+        rebuild_cache=args.rebuild_cache,
+        chunksize=args.chunksize,
+        seed=args.seed,
+        sample_strategy=args.sample_strategy or ('head' if args.test else 'random'),
+        n_jobs=args.jobs,
+        build_geodataframe=args.geo,
+        partition_by_naics=args.partition_by_naics,
+        compression=args.compression,
+        compression_level=args.compression_level,
+        schema_only=args.schema_only
     )
     
     if success:
@@ -2,256 +2,888 @@ import googlemaps
 import os
 import time
 import math
+import random
+import asyncio
+import threading
+import importlib.util
+import logging
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import requests
+import numpy as np
+import shapely
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from src.utils.cache import CACHE_DIR, DiskCache, JSONFileCache, make_cache_key
+from src.utils.helpers import json_loads
+from src.utils.rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 
+# Geocoded ZIP/location centroids are static, so they persist across runs
+GEOCODE_CACHE_PATH = CACHE_DIR / "geocode.json"
+# Text search and Place Details responses, reused for a week
+RESPONSE_CACHE_DIR = CACHE_DIR / "google_maps"
+
+PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+NEARBY_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+PLACE_DETAILS_FIELDS = [
+    'name', 'formatted_address', 'formatted_phone_number',
+    'type', 'business_status', 'price_level',
+    'geometry', 'website', 'opening_hours',
+    'reviews', 'rating', 'user_ratings_total', 'url',
+    'serves_beer', 'serves_wine', 'serves_breakfast',
+    'serves_lunch', 'serves_dinner'
+]
+# Place Details is billed per field group, so callers ask only for the
+# groups they read. All three together give PLACE_DETAILS_FIELDS.
+PLACE_DETAILS_FIELD_TIERS = {
+    'basic': {'name', 'formatted_address', 'type', 'business_status', 'geometry', 'url'},
+    'contact': {'formatted_phone_number', 'website', 'opening_hours'},
+    'atmosphere': {
+        'price_level', 'reviews', 'rating', 'user_ratings_total',
+        'serves_beer', 'serves_wine', 'serves_breakfast',
+        'serves_lunch', 'serves_dinner'
+    }
+}
+ALL_DETAIL_TIERS = ('basic', 'contact', 'atmosphere')
+
+# Sync googlemaps client: per-request timeout (seconds) and pooled connections,
+# sized for the worker threads of every agent in the process
+REQUEST_TIMEOUT = 30
+SYNC_POOL_MAXSIZE = 50
+
+# A fresh next_page_token takes a moment to become valid; until then the API
+# answers INVALID_REQUEST. Retry with exponential backoff (0.25s, 0.5s, 1s, ...)
+PAGE_TOKEN_INITIAL_BACKOFF = 0.25
+PAGE_TOKEN_MAX_ATTEMPTS = 5
+# Async requests wait this long (once) after OVER_QUERY_LIMIT; the sync
+# googlemaps client retries that status itself
+OVER_QUERY_LIMIT_BACKOFF = 30
+# Shared by every agent and worker thread to cap in-flight Places requests
+PLACES_REQUEST_SLOTS = threading.BoundedSemaphore(10)
+
+# Default smallest cell side: quadtree grid search stops splitting once cells
+# would be smaller than this
+MIN_QUAD_CELL_M = 100
+# Search cell: center, half of its side length in meters, tree depth, and the
+# cosine of the search's center latitude for meter/degree conversion
+Quad = namedtuple('Quad', ['lat', 'lng', 'half_m', 'depth', 'cos_lat'])
+
+# Concurrent requests per agent for the async search methods
+ASYNC_PLACES_CONCURRENCY = 10
+# Sustained request rate per agent (token bucket); Places allows ~50 QPS per
+# project, so concurrent cells queue here instead of tripping OVER_QUERY_LIMIT
+ASYNC_PLACES_QPS = 50
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One googlemaps client per process, so every agent (and worker thread) shares
+# its keep-alive connection pool and its queries-per-second limiter
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client():
+    """
+    Return the process-wide googlemaps client, creating it on first use.
+
+    The SDK's default session pools only 10 connections, fewer than the
+    thread-pooled helpers run at once, so it is given a larger keep-alive
+    pool. Retries stay with the SDK.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SYNC_POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            _shared_client = googlemaps.Client(
+                key=API_KEY,
+                timeout=REQUEST_TIMEOUT,
+                requests_session=session
+            )
+    return _shared_client
+
+
 class GoogleMapsAgent:
- def __init__(self):
- if not API_KEY:
- print("Warning: Missing GOOGLE_MAPS_API_KEY in .env")
- self.client = None
- else:
- self.client = googlemaps.Client(key=API_KEY)
-
- def search_places(self, query): 
- """
- Robust Search that fights for every page.
- Automatically handles pagination up to the API limit (60 results).
- """
- if not self.client:
- return []
- 
- all_results = []
- next_token = None
- 
- # We try to fetch up to 5 pages (Google's Limit per query)
- for page_num in range(5): 
- try:
- response = None
- 
- # --- RETRY LOGIC FOR TOKEN ---
- # If we have a token, we must wait until it is valid.
- if next_token:
- attempts = 0
- while attempts < 5:
- print(f" ... Fetching Page {page_num + 1} (Attempt {attempts+1})...")
- time.sleep(2 + attempts) # Wait 2s, then 3s, then 4s...
- try:
- response = self.client.places(query=query, page_token=next_token)
- if response['status'] == 'OK':
- break # Success!
- else:
- print(f" [Google Status: {response['status']}] Retrying...")
- except Exception as e:
- print(f" [Error] {e}. Retrying...")
- 
- attempts += 1
- else:
- # First page (No token needed)
- response = self.client.places(query=query)
- 
- # --- PROCESS RESULTS ---
- if response and response.get('status') == 'OK':
- results = response['results']
- all_results.extend(results)
- 
- # Check for next page
- next_token = response.get('next_page_token')
- if not next_token:
- print(" ... No more pages for this specific query.")
- break
- else:
- print(" ... Failed to get valid response.")
- break
- 
- except Exception as e:
- print(f"Search Critical Error: {e}")
- break
- 
- return all_results
-
- def geocode_location(self, location_text):
- """
- Geocode a location string to latitude/longitude.
-
- Args:
- location_text (str): e.g., "55401 Minneapolis MN"
-
- Returns:
- dict: {"lat": float, "lng": float} or None
- """
- if not self.client:
- return None
- try:
- results = self.client.geocode(location_text)
- if not results:
- return None
- loc = results[0].get('geometry', {}).get('location')
- if not loc:
- return None
- return {"lat": loc.get('lat'), "lng": loc.get('lng')}
- except Exception:
- return None
-
- def _meters_to_degrees(self, meters, latitude):
- """
- Convert meters to degrees latitude/longitude at a given latitude.
- """
- lat_deg = meters / 111320.0
- lng_deg = meters / (111320.0 * math.cos(math.radians(latitude))) if latitude else 0
- return lat_deg, lng_deg
-
- def generate_grid_points(self, center_lat, center_lng, radius_m, spacing_m):
- """
- Generate grid points around a center within a radius.
-
- Args:
- center_lat (float): Center latitude
- center_lng (float): Center longitude
- radius_m (int): Radius in meters
- spacing_m (int): Grid spacing in meters
-
- Returns:
- list: List of (lat, lng) tuples
- """
- lat_step, lng_step = self._meters_to_degrees(spacing_m, center_lat)
- lat_radius, lng_radius = self._meters_to_degrees(radius_m, center_lat)
-
- points = []
- lat = center_lat - lat_radius
- while lat <= center_lat + lat_radius:
- lng = center_lng - lng_radius
- while lng <= center_lng + lng_radius:
- points.append((lat, lng))
- lng += lng_step
- lat += lat_step
- return points
-
- def search_places_grid(self, keyword, center_lat, center_lng, radius_m=2000, spacing_m=500):
- """
- Adaptive grid-based search that subdivides cells until each has <60 results.
- 
- This ensures complete coverage of the ZIP code area by:
- 1. Dividing the area into initial grid cells
- 2. Searching each cell
- 3. Recursively subdividing cells with 60 results
- 4. Deduplicating across all cells
-
- Args:
- keyword (str): Search keyword (e.g., "coffee shop")
- center_lat (float): Center latitude
- center_lng (float): Center longitude
- radius_m (int): Initial search area radius (default 2000m)
- spacing_m (int): Initial cell size (default 500m)
-
- Returns:
- list: Deduplicated place results with complete coverage
- """
- if not self.client:
- return []
-
- all_results = {}
- 
- def search_cell(cell_center_lat, cell_center_lng, cell_radius_m, depth=0):
- """
- Recursively search a cell, subdividing if it returns 60 results.
- 
- Args:
- cell_center_lat: Cell center latitude
- cell_center_lng: Cell center longitude
- cell_radius_m: Cell search radius
- depth: Recursion depth (max 3 to prevent infinite subdivision)
- """
- # Search this cell with pagination to get all results
- cell_results = []
- next_token = None
- 
- for page_num in range(3): # Max 3 pages = up to 60 results per cell
- try:
- if next_token:
- attempts = 0
- while attempts < 5:
- time.sleep(2 + attempts)
- response = self.client.places_nearby(
- location=(cell_center_lat, cell_center_lng),
- radius=cell_radius_m,
- keyword=keyword,
- page_token=next_token
- )
- if response.get('status') == 'OK':
- break
- attempts += 1
- else:
- response = self.client.places_nearby(
- location=(cell_center_lat, cell_center_lng),
- radius=cell_radius_m,
- keyword=keyword
- )
-
- if response and response.get('status') == 'OK':
- results = response.get('results', [])
- cell_results.extend(results)
- next_token = response.get('next_page_token')
- if not next_token:
- break
- else:
- break
- except Exception:
- break
- 
- # If cell has 55 results and we haven't reached max depth, subdivide
- # (Use 55 as threshold to be safe, since Google may return slightly different counts)
- if len(cell_results) >= 55 and depth < 3:
- print(f" Cell ({cell_center_lat:.4f},{cell_center_lng:.4f}) has {len(cell_results)} results, subdividing...")
- 
- # Calculate offsets for 4 quadrants (NE, NW, SE, SW)
- lat_offset = (cell_radius_m / 2) / 111320.0 # ~111km per degree latitude
- lng_offset = (cell_radius_m / 2) / (111320.0 * math.cos(math.radians(cell_center_lat)))
- 
- quadrants = [
- (cell_center_lat + lat_offset, cell_center_lng + lng_offset), # NE
- (cell_center_lat + lat_offset, cell_center_lng - lng_offset), # NW
- (cell_center_lat - lat_offset, cell_center_lng + lng_offset), # SE
- (cell_center_lat - lat_offset, cell_center_lng - lng_offset), # SW
- ]
- 
- # Recursively search each quadrant with half the radius
- for quad_lat, quad_lng in quadrants:
- search_cell(quad_lat, quad_lng, cell_radius_m // 2, depth + 1)
- else:
- # Add results to global collection (deduplicated by place_id)
- for place in cell_results:
- pid = place.get('place_id')
- if pid:
- all_results[pid] = place
- 
- # Generate initial grid covering the search area
- grid_points = self.generate_grid_points(center_lat, center_lng, radius_m, spacing_m)
- 
- print(f" Searching {len(grid_points)} initial grid cells...")
- for idx, (lat, lng) in enumerate(grid_points, 1):
- search_cell(lat, lng, spacing_m, depth=0)
- 
- return list(all_results.values())
-
- def get_place_details(self, place_id):
- # ... (Keep existing logic) ...
- if not self.client:
- return {}
- try:
- result = self.client.place(
- place_id=place_id, 
- fields=[
- 'name', 'formatted_address', 'formatted_phone_number', 
- 'type', 'business_status', 'price_level',
- 'geometry', 'website', 'opening_hours',
- 'reviews', 'rating', 'user_ratings_total', 'url',
- 'serves_beer', 'serves_wine', 'serves_breakfast', 
- 'serves_lunch', 'serves_dinner' 
- ]
- )
- return result.get('result', {})
- except Exception as e:
- return {}
\ No newline at end of file
+    def __init__(self, use_cache=True):
+        if not API_KEY:
+            print("Warning: Missing GOOGLE_MAPS_API_KEY in .env")
+            self.client = None
+        else:
+            self.client = get_shared_client()
+        self._geocode_cache = JSONFileCache(GEOCODE_CACHE_PATH)
+        self._response_cache = DiskCache(RESPONSE_CACHE_DIR, enabled=use_cache)
+        # Long-lived async HTTP client, created on first use inside the event loop
+        self._http = None
+        self._http_slots = None
+        self._http_rate = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _async_client(self):
+        """
+        Return the agent's shared httpx.AsyncClient, creating it on first use.
+
+        The client (and its connection pool) belongs to the running event
+        loop; use one agent per loop and close it with aclose().
+        """
+        if self._http is None:
+            limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            self._http = httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=30, limits=limits)
+            self._http_slots = asyncio.Semaphore(ASYNC_PLACES_CONCURRENCY)
+            self._http_rate = AsyncRateLimiter(ASYNC_PLACES_QPS)
+        return self._http
+
+    async def aclose(self):
+        """
+        Close the shared async HTTP client, if one was opened.
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._http_slots = None
+            self._http_rate = None
+
+    async def _aget_places_page(self, url, params):
+        """
+        GET one Places web-service results page.
+
+        Follow-up pages (params carry a pagetoken) are retried with jittered
+        exponential backoff while Google reports INVALID_REQUEST, which is
+        how it signals that the token is not active yet. OVER_QUERY_LIMIT
+        pauses OVER_QUERY_LIMIT_BACKOFF seconds once and retries any page.
+
+        Args:
+            url (str): Text Search or Nearby Search endpoint
+            params (dict): Query parameters, without the API key
+
+        Returns:
+            dict: Parsed response with status OK/ZERO_RESULTS, or None
+        """
+        http = self._async_client()
+        is_follow_up = 'pagetoken' in params
+        max_attempts = PAGE_TOKEN_MAX_ATTEMPTS if is_follow_up else 1
+        backoff = PAGE_TOKEN_INITIAL_BACKOFF
+        throttled = False
+        attempt = 0
+        while attempt < max_attempts:
+            attempt += 1
+            if is_follow_up:
+                await asyncio.sleep(backoff + random.random() * 0.1)
+                backoff *= 2
+            async with self._http_slots, self._http_rate:
+                try:
+                    response = await http.get(url, params={**params, 'key': API_KEY})
+                    response.raise_for_status()
+                    data = json_loads(response.content)
+                except (httpx.HTTPError, ValueError) as e:
+                    # Exception text includes the request URL (and API key), so log the type only
+                    logger.debug("Places request failed (%s), retrying", type(e).__name__)
+                    continue
+            status = data.get('status')
+            if status in ('OK', 'ZERO_RESULTS'):
+                return data
+            if status == 'OVER_QUERY_LIMIT' and not throttled:
+                # Quota exhausted: one long pause rather than a retry storm
+                logger.warning("Google status %s, backing off %ss", status, OVER_QUERY_LIMIT_BACKOFF)
+                throttled = True
+                attempt -= 1
+                await asyncio.sleep(OVER_QUERY_LIMIT_BACKOFF + random.random())
+                continue
+            if status != 'INVALID_REQUEST' or not is_follow_up:
+                logger.warning("Google status %s, giving up on this page", status)
+                return None
+        return None
+
+    async def _asearch_pages(self, url, params, max_pages):
+        """
+        Collect results across up to max_pages pages of a Places search.
+
+        Returns:
+            tuple: (results, complete); complete is True only when the last
+                page came back without a next_page_token, i.e. nothing was
+                cut short by a failed page
+        """
+        results = []
+        page_params = params
+        for _ in range(max_pages):
+            data = await self._aget_places_page(url, page_params)
+            if not data:
+                break
+            results.extend(data.get('results', []))
+            next_token = data.get('next_page_token')
+            if not next_token:
+                return results, True
+            # Google ignores every other parameter when a pagetoken is given
+            page_params = {'pagetoken': next_token}
+        return results, False
+
+    def _places_request(self, method, **kwargs):
+        """
+        Call a googlemaps Places method while holding a shared request slot.
+        """
+        with PLACES_REQUEST_SLOTS:
+            return method(**kwargs)
+
+    def _fetch_next_page(self, method, **kwargs):
+        """
+        Fetch a follow-up results page, waiting for its page_token to activate.
+
+        Retries only while Google reports INVALID_REQUEST (token not ready)
+        or a transient error occurs, doubling a jittered backoff each time.
+        ZERO_RESULTS is final and returned at once.
+
+        Args:
+            method: googlemaps client method (places or places_nearby)
+            **kwargs: Arguments for the method, including page_token
+
+        Returns:
+            dict: API response, or None if the page could not be fetched
+        """
+        backoff = PAGE_TOKEN_INITIAL_BACKOFF
+        for _ in range(PAGE_TOKEN_MAX_ATTEMPTS):
+            time.sleep(backoff + random.random() * 0.1)
+            try:
+                response = self._places_request(method, **kwargs)
+                status = response.get('status')
+                if status in ('OK', 'ZERO_RESULTS'):
+                    return response
+                if status != 'INVALID_REQUEST':
+                    logger.warning("Google status %s, giving up on this page", status)
+                    return None
+                logger.debug("Google status %s, retrying", status)
+            except googlemaps.exceptions.ApiError as e:
+                if e.status == 'ZERO_RESULTS':
+                    return None
+                if e.status != 'INVALID_REQUEST':
+                    logger.warning("Google status %s, giving up on this page", e.status)
+                    return None
+            except Exception as e:
+                logger.debug("Page request failed (%s), retrying", e)
+            backoff *= 2
+        return None
+
+    def search_places(self, query):
+        """
+        Robust Search that fights for every page.
+        Automatically handles pagination up to the API limit (60 results).
+        Non-empty results are cached on disk by query once every page has
+        been fetched; a run cut short by a failed page is not cached.
+        """
+        cache_key = make_cache_key('places', query)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not self.client:
+            return []
+
+        all_results = []
+        next_token = None
+        complete = False
+
+        # We try to fetch up to 5 pages (Google's Limit per query)
+        for page_num in range(5):
+            try:
+                response = None
+
+                if next_token:
+                    # Token may not be active yet; back off until it is
+                    logger.debug("Fetching page %d", page_num + 1)
+                    response = self._fetch_next_page(
+                        self.client.places, query=query, page_token=next_token
+                    )
+                else:
+                    # First page (No token needed)
+                    response = self._places_request(self.client.places, query=query)
+
+                # --- PROCESS RESULTS ---
+                if response and response.get('status') == 'OK':
+                    results = response['results']
+                    all_results.extend(results)
+
+                    # Check for next page
+                    next_token = response.get('next_page_token')
+                    if not next_token:
+                        logger.debug("No more pages for this query")
+                        complete = True
+                        break
+                else:
+                    logger.debug("Failed to get a valid response")
+                    break
+
+            except Exception as e:
+                logger.warning("Search error for %r: %s", query, e)
+                break
+
+        if all_results and complete:
+            self._response_cache.set(cache_key, all_results)
+        return all_results
+
+    async def asearch_places(self, query):
+        """
+        Async Text Search over the agent's shared HTTP client.
+
+        Same results and disk cache as search_places, but page waits are
+        non-blocking so many queries can be awaited together with
+        asyncio.gather.
+        """
+        cache_key = make_cache_key('places', query)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not self.client:
+            return []
+
+        all_results, complete = await self._asearch_pages(TEXT_SEARCH_URL, {'query': query}, max_pages=5)
+        if all_results and complete:
+            self._response_cache.set(cache_key, all_results)
+        return all_results
+
+    def search_places_many(self, queries):
+        """
+        Run search_places once per distinct query.
+
+        Batch callers often build the same query for many rows (same chain,
+        same city). Duplicates are coalesced before any API call, and the
+        returned dict can be broadcast back with Series.map.
+
+        Args:
+            queries (iterable): Search queries, possibly repeated (blanks/NaN skipped)
+
+        Returns:
+            dict: {query: list of place results} for each unique query
+        """
+        unique_queries = dict.fromkeys(q for q in queries if isinstance(q, str) and q)
+        return {query: self.search_places(query) for query in unique_queries}
+
+    def geocode_location(self, location_text):
+        """
+        Geocode a location string to latitude/longitude.
+
+        Successful lookups are cached in data/cache/geocode.json keyed by
+        the query string, so repeated runs skip the Geocoding API.
+
+        Args:
+            location_text (str): e.g., "55401 Minneapolis MN"
+
+        Returns:
+            dict: {"lat": float, "lng": float} or None
+        """
+        cached = self._geocode_cache.get(location_text)
+        if cached is not None:
+            return dict(cached)
+        if not self.client:
+            return None
+        try:
+            results = self.client.geocode(location_text)
+            if not results:
+                return None
+            loc = results[0].get('geometry', {}).get('location')
+            if not loc:
+                return None
+            location = {"lat": loc.get('lat'), "lng": loc.get('lng')}
+            self._geocode_cache.set(location_text, location)
+            return dict(location)
+        except Exception:
+            return None
+
+    def _meters_to_degrees(self, meters, cos_lat):
+        """
+        Convert meters to degrees latitude/longitude.
+
+        Args:
+            meters (float): Distance in meters
+            cos_lat (float): Cosine of the latitude, computed once per search
+                so cells and grid points don't each redo the trig
+
+        Returns:
+            tuple: (lat_degrees, lng_degrees)
+        """
+        return meters / 111320.0, meters / (111320.0 * cos_lat)
+
+    def _root_quad(self, center_lat, center_lng, radius_m):
+        """
+        Root of the search quadtree: the square of half-side radius_m.
+
+        The center's cosine is shared by the whole tree; over a few km the
+        change in latitude moves cell edges by well under a meter.
+        """
+        return Quad(center_lat, center_lng, radius_m, 0, math.cos(math.radians(center_lat)))
+
+    def _quad_max_depth(self, radius_m, min_cell_m=MIN_QUAD_CELL_M):
+        """
+        Deepest level before cells drop below min_cell_m on a side.
+        """
+        return max(0, math.ceil(math.log2(2 * radius_m / min_cell_m)))
+
+    def _quad_children(self, quad):
+        """
+        Split a quad into its NE, NW, SE and SW quarters.
+        """
+        half_m = quad.half_m / 2
+        lat_offset, lng_offset = self._meters_to_degrees(half_m, quad.cos_lat)
+        return [
+            Quad(quad.lat + dlat, quad.lng + dlng, half_m, quad.depth + 1, quad.cos_lat)
+            for dlat in (lat_offset, -lat_offset)
+            for dlng in (lng_offset, -lng_offset)
+        ]
+
+    def _quad_outside(self, quad, boundary):
+        """
+        True when a quad's square has no interior overlap with the boundary.
+        """
+        if boundary is None:
+            return False
+        lat_offset, lng_offset = self._meters_to_degrees(quad.half_m, quad.cos_lat)
+        square = shapely.box(quad.lng - lng_offset, quad.lat - lat_offset,
+                             quad.lng + lng_offset, quad.lat + lat_offset)
+        # A square that only shares an edge holds no place contains_xy would keep
+        return not boundary.intersects(square) or boundary.touches(square)
+
+    def _quad_cache_key(self, keyword, quad):
+        # Rounded to ~1cm so float noise in child centers doesn't miss the cache
+        return make_cache_key('nearby', keyword, round(quad.lat, 7), round(quad.lng, 7), quad.half_m)
+
+    def _search_quad(self, keyword, quad):
+        """
+        Nearby Search (up to 3 pages) over the circle circumscribing a quad.
+
+        Returns:
+            tuple: (results, complete); see _asearch_pages
+        """
+        cell_results = []
+        next_token = None
+        # Circumscribed circle so the square's corners are covered
+        radius = int(math.ceil(quad.half_m * math.sqrt(2)))
+
+        for page_num in range(3): # Max 3 pages = up to 60 results per cell
+            try:
+                if next_token:
+                    response = self._fetch_next_page(
+                        self.client.places_nearby,
+                        location=(quad.lat, quad.lng),
+                        radius=radius,
+                        keyword=keyword,
+                        page_token=next_token
+                    )
+                else:
+                    response = self._places_request(
+                        self.client.places_nearby,
+                        location=(quad.lat, quad.lng),
+                        radius=radius,
+                        keyword=keyword
+                    )
+
+                if response and response.get('status') == 'OK':
+                    results = response.get('results', [])
+                    cell_results.extend(results)
+                    next_token = response.get('next_page_token')
+                    if not next_token:
+                        return cell_results, True
+                else:
+                    break
+            except Exception:
+                break
+        return cell_results, False
+
+    def _clip_to_boundary(self, places, boundary):
+        """
+        Keep places whose location falls inside a (lon, lat) shapely geometry.
+
+        Places without a location are kept, since they cannot be ruled out.
+        """
+        if boundary is None or not places:
+            return places
+        shapely.prepare(boundary)
+        locations = [p.get('geometry', {}).get('location') or {} for p in places]
+        lngs = np.array([loc.get('lng', np.nan) for loc in locations], dtype=float)
+        lats = np.array([loc.get('lat', np.nan) for loc in locations], dtype=float)
+        keep = shapely.contains_xy(boundary, lngs, lats) | np.isnan(lngs) | np.isnan(lats)
+        return [place for place, inside in zip(places, keep) if inside]
+
+    def search_places_grid(self, keyword, center_lat, center_lng, radius_m=2000, spacing_m=MIN_QUAD_CELL_M,
+                           boundary=None):
+        """
+        Adaptive quadtree search that subdivides cells until each has <60 results.
+
+        This ensures complete coverage of the search square by:
+        1. Searching one root cell covering the whole square
+        2. Splitting any cell that returns a saturated page set (>=55) into
+           four quarters, down to spacing_m per side
+        3. Deduplicating across all leaf cells (see iter_places_grid)
+
+        With a boundary, cells whose square misses it entirely are pruned
+        before they are queried, and surviving places are clipped to it.
+
+        Sparse areas cost a single query instead of one per grid cell; only
+        dense cells pay for deeper levels. Non-empty, fully paged cell responses
+        are cached on disk, so repeated runs over the same area make no requests.
+
+        Args:
+            keyword (str): Search keyword (e.g., "coffee shop")
+            center_lat (float): Center latitude
+            center_lng (float): Center longitude
+            radius_m (int): Half-side of the search square (default 2000m)
+            spacing_m (int): Smallest cell side in meters; saturated cells are
+                not split below this (default MIN_QUAD_CELL_M)
+            boundary: Optional shapely geometry in (lon, lat); places outside
+                it are dropped before anyone pays for their details
+
+        Returns:
+            list: Deduplicated place results with complete coverage
+        """
+        if not self.client:
+            return []
+        return list(self.iter_places_grid(keyword, center_lat, center_lng, radius_m, spacing_m=spacing_m,
+                                          boundary=boundary))
+
+    def iter_places_grid(self, keyword, center_lat, center_lng, radius_m=2000, spacing_m=MIN_QUAD_CELL_M,
+                         boundary=None, seen=None):
+        """
+        Generator form of search_places_grid.
+
+        Each place is yielded once, as soon as its leaf cell has been searched.
+        Only place_ids are kept for deduplication, so large searches can stream
+        places downstream (or to disk) without holding every place dict.
+
+        Args:
+            keyword (str): Search keyword (e.g., "coffee shop")
+            center_lat (float): Center latitude
+            center_lng (float): Center longitude
+            radius_m (int): Half-side of the search square (default 2000m)
+            spacing_m (int): Smallest cell side in meters; see search_places_grid
+            boundary: Optional shapely geometry in (lon, lat); see search_places_grid
+            seen (set): place_ids to skip; pass the same set to several
+                searches (e.g. neighbouring ZIPs) to deduplicate across them
+
+        Yields:
+            dict: Place results not seen before
+        """
+        if not self.client:
+            return
+
+        seen = set() if seen is None else seen
+        max_depth = self._quad_max_depth(radius_m, spacing_m)
+        worklist = deque([self._root_quad(center_lat, center_lng, radius_m)])
+        if boundary is not None:
+            shapely.prepare(boundary)
+
+        print(f" Searching quadtree over a {2 * radius_m}m square (max depth {max_depth})...")
+        while worklist:
+            quad = worklist.popleft()
+            # Nothing inside this square can be kept, so never query it
+            if self._quad_outside(quad, boundary):
+                continue
+            # Cells are cached individually, so a re-run (or a ZIP whose square
+            # reuses a cell) skips the network for every cell already seen
+            cache_key = self._quad_cache_key(keyword, quad)
+            cell_results = self._response_cache.get(cache_key)
+            if cell_results is None:
+                cell_results, complete = self._search_quad(keyword, quad)
+                if cell_results and complete:
+                    self._response_cache.set(cache_key, cell_results)
+
+            # Use 55 as threshold to be safe, since Google may return slightly different counts
+            if len(cell_results) >= 55 and quad.depth < max_depth:
+                logger.debug("Cell (%.4f,%.4f) has %d results, subdividing",
+                             quad.lat, quad.lng, len(cell_results))
+                worklist.extend(self._quad_children(quad))
+                continue
+
+            # Emit places not seen in an earlier leaf (deduplicated by place_id)
+            new_places = []
+            for place in cell_results:
+                pid = place.get('place_id')
+                if pid and pid not in seen:
+                    seen.add(pid)
+                    new_places.append(place)
+            yield from self._clip_to_boundary(new_places, boundary)
+
+    async def asearch_places_grid(self, keyword, center_lat, center_lng, radius_m=2000, spacing_m=MIN_QUAD_CELL_M,
+                                  boundary=None):
+        """
+        Async version of search_places_grid.
+
+        The same quadtree is explored with every quarter of a subdivided cell
+        searched concurrently over the shared HTTP client, bounded by
+        ASYNC_PLACES_CONCURRENCY.
+
+        Args:
+            keyword (str): Search keyword (e.g., "coffee shop")
+            center_lat (float): Center latitude
+            center_lng (float): Center longitude
+            radius_m (int): Half-side of the search square (default 2000m)
+            spacing_m (int): Smallest cell side in meters; see search_places_grid
+            boundary: Optional shapely geometry in (lon, lat); places outside
+                it are dropped before anyone pays for their details
+
+        Returns:
+            list: Deduplicated place results with complete coverage
+        """
+        if not self.client:
+            return []
+
+        # Single event loop, so the shared dict needs no lock
+        all_results = {}
+        max_depth = self._quad_max_depth(radius_m, spacing_m)
+
+        if boundary is not None:
+            shapely.prepare(boundary)
+
+        async def search_quad(quad):
+            if self._quad_outside(quad, boundary):
+                return
+            cache_key = self._quad_cache_key(keyword, quad)
+            cell_results = self._response_cache.get(cache_key)
+            if cell_results is None:
+                cell_results, complete = await self._asearch_pages(
+                    NEARBY_SEARCH_URL,
+                    {
+                        'location': f"{quad.lat},{quad.lng}",
+                        'radius': int(math.ceil(quad.half_m * math.sqrt(2))),
+                        'keyword': keyword
+                    },
+                    max_pages=3
+                )
+                if cell_results and complete:
+                    self._response_cache.set(cache_key, cell_results)
+
+            if len(cell_results) >= 55 and quad.depth < max_depth:
+                logger.debug("Cell (%.4f,%.4f) has %d results, subdividing",
+                             quad.lat, quad.lng, len(cell_results))
+                await asyncio.gather(*(search_quad(child) for child in self._quad_children(quad)))
+            else:
+                for place in cell_results:
+                    pid = place.get('place_id')
+                    if pid:
+                        all_results[pid] = place
+
+        print(f" Searching quadtree over a {2 * radius_m}m square (max depth {max_depth})...")
+        await search_quad(self._root_quad(center_lat, center_lng, radius_m))
+
+        return self._clip_to_boundary(list(all_results.values()), boundary)
+
+    def search_zip_codes(self, keyword, zip_codes, city, state, radius_m=2000, spacing_m=MIN_QUAD_CELL_M,
+                         max_workers=8, boundary=None):
+        """
+        Grid-search several ZIP codes concurrently.
+
+        Each ZIP is geocoded and searched with search_places_grid on a worker
+        thread, since the work is network-bound. Results are merged and
+        deduplicated by place_id on the calling thread, so no locking is needed.
+
+        Args:
+            keyword (str): Search keyword (e.g., "coffee shop")
+            zip_codes (list): ZIP codes to search
+            city (str): City name used for geocoding
+            state (str): State abbreviation used for geocoding
+            radius_m (int): Search radius around each ZIP centroid
+            spacing_m (int): Smallest quadtree cell side in meters
+            max_workers (int): Maximum concurrent ZIP searches
+            boundary: Optional shapely geometry in (lon, lat), e.g.
+                CityBoundary.to_shape(); places outside it are dropped
+
+        Returns:
+            list: Deduplicated place results across all ZIP codes
+        """
+        if not self.client:
+            return []
+
+        def search_one(zip_code):
+            center = self.geocode_location(f"{zip_code} {city} {state}")
+            if not center:
+                print(f" Could not geocode ZIP {zip_code}, skipping")
+                return zip_code, []
+            return zip_code, self.search_places_grid(
+                keyword, center['lat'], center['lng'], radius_m=radius_m, spacing_m=spacing_m,
+                boundary=boundary
+            )
+
+        all_places = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for zip_code, results in executor.map(search_one, zip_codes):
+                print(f" ZIP {zip_code}: {len(results)} places")
+                for place in results:
+                    pid = place.get('place_id')
+                    if pid and pid not in all_places:
+                        all_places[pid] = place
+
+        return list(all_places.values())
+
+    def _details_fields(self, tiers):
+        """
+        Place Details fields for the given tiers, in PLACE_DETAILS_FIELDS order.
+        """
+        wanted = set().union(*(PLACE_DETAILS_FIELD_TIERS[tier] for tier in tiers))
+        return [field for field in PLACE_DETAILS_FIELDS if field in wanted]
+
+    def _details_cache_key(self, place_id, fields):
+        return make_cache_key('place_details', place_id, fields)
+
+    def get_place_details(self, place_id, tiers=ALL_DETAIL_TIERS):
+        """
+        Fetch Place Details for one place_id.
+
+        Args:
+            place_id (str): Google place_id
+            tiers (tuple): Field groups to request ('basic', 'contact',
+                'atmosphere'); the default asks for every field, reviews included
+
+        Returns:
+            dict: Place details ({} on failure)
+        """
+        fields = self._details_fields(tiers)
+        cache_key = self._details_cache_key(place_id, fields)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not self.client:
+            return {}
+        try:
+            result = self.client.place(
+                place_id=place_id,
+                fields=fields
+            )
+            details = result.get('result', {})
+            if details:
+                self._response_cache.set(cache_key, details)
+            return details
+        except Exception as e:
+            return {}
+
+    def get_place_details_basic(self, place_id):
+        """
+        Name, address, location, types and business_status only (Basic SKU).
+        """
+        return self.get_place_details(place_id, tiers=('basic',))
+
+    def get_place_details_many(self, place_ids, max_workers=16, tiers=ALL_DETAIL_TIERS):
+        """
+        Fetch Place Details for many place_ids on a thread pool.
+
+        Synchronous counterpart to aget_place_details_many for callers that
+        are not running an event loop. Cached details are served from disk
+        and only the misses are sent to the pool.
+
+        Args:
+            place_ids (list): Google place_ids
+            max_workers (int): Maximum concurrent requests
+            tiers (tuple): Field groups to request (see get_place_details)
+
+        Returns:
+            list: Detail dicts in the same order as place_ids ({} on failure)
+        """
+        fields = self._details_fields(tiers)
+        results = [self._response_cache.get(self._details_cache_key(pid, fields)) for pid in place_ids]
+        missing = [i for i, details in enumerate(results) if details is None]
+        if not missing:
+            return results
+        if not self.client:
+            return [details or {} for details in results]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = executor.map(lambda pid: self.get_place_details(pid, tiers), [place_ids[i] for i in missing])
+            for i, details in zip(missing, fetched):
+                results[i] = details
+        return results
+
+    async def aget_place_details(self, place_id, tiers=ALL_DETAIL_TIERS):
+        """
+        Async get_place_details over the agent's shared HTTP client.
+
+        Args:
+            place_id (str): Google place_id
+            tiers (tuple): Field groups to request (see get_place_details)
+
+        Returns:
+            dict: Place details ({} on failure)
+        """
+        fields = self._details_fields(tiers)
+        cache_key = self._details_cache_key(place_id, fields)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not self.client:
+            return {}
+
+        http = self._async_client()
+        async with self._http_slots, self._http_rate:
+            try:
+                response = await http.get(
+                    PLACE_DETAILS_URL,
+                    params={'place_id': place_id, 'fields': ','.join(fields), 'key': API_KEY}
+                )
+                response.raise_for_status()
+                data = json_loads(response.content)
+            except (httpx.HTTPError, ValueError) as e:
+                # Exception text includes the request URL (and API key), so log the type only
+                logger.warning("Place Details request failed for %s (%s)", place_id, type(e).__name__)
+                return {}
+        if data.get('status') != 'OK':
+            return {}
+        details = data.get('result', {})
+        if details:
+            self._response_cache.set(cache_key, details)
+        return details
+
+    async def aget_place_details_many(self, place_ids, tiers=ALL_DETAIL_TIERS, concurrency=None):
+        """
+        Fetch Place Details for many place_ids concurrently.
+
+        All lookups are issued at once over the shared client; its connection
+        pool and ASYNC_PLACES_CONCURRENCY bound how many are in flight.
+
+        Args:
+            place_ids (list): Google place_ids
+            tiers (tuple): Field groups to request (see get_place_details)
+            concurrency (int): Optional lower cap on lookups in flight
+
+        Returns:
+            list: Detail dicts in the same order as place_ids ({} on failure)
+        """
+        if concurrency is None:
+            return list(await asyncio.gather(*(self.aget_place_details(pid, tiers) for pid in place_ids)))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(place_id):
+            async with semaphore:
+                return await self.aget_place_details(place_id, tiers)
+
+        return list(await asyncio.gather(*(fetch(pid) for pid in place_ids)))
+
+    async def get_place_details_batch(self, place_ids, concurrency=20):
+        """
+        Fetch Place Details for many place_ids concurrently.
+
+        Kept for existing callers; prefer aget_place_details_many inside an
+        `async with GoogleMapsAgent()` block. The shared client is closed
+        afterwards if this call created it.
+
+        Args:
+            place_ids (list): Google place_ids
+            concurrency (int): Maximum lookups in flight (the agent-wide
+                ASYNC_PLACES_CONCURRENCY cap still applies)
+
+        Returns:
+            list: Detail dicts in the same order as place_ids ({} on failure)
+        """
+        owns_client = self._http is None
+        try:
+            return await self.aget_place_details_many(place_ids, concurrency=concurrency)
+        finally:
+            if owns_client:
+                await self.aclose()
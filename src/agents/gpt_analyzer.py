@@ -4,63 +4,92 @@ Analyzes business data to determine status, employment, and reliability
 """
 
 import os
+import re
 import json
+import asyncio
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Optional
-from openai import OpenAI
+from typing import Callable, Dict, List, Optional
+import httpx
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI
 from dotenv import load_dotenv
 
+from src.utils.cache import CACHE_DIR, DiskCache, make_cache_key
+from src.utils.helpers import days_since_last_review, json_loads
+from src.utils.rate_limiter import AsyncRateLimiter
+
 load_dotenv()
 
+# Parsed replies keyed by a hash of the exact request (model, temperature,
+# prompts), so editing a prompt invalidates its entries automatically
+RESPONSE_CACHE_DIR = CACHE_DIR / "gpt"
 
-class GPTAnalyzer:
- """
- Uses GPT-4o-mini to analyze business data and make intelligent classifications
- """
- 
- def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.0):
- api_key = os.getenv("OPENAI_API_KEY")
- if not api_key:
- raise ValueError("OPENAI_API_KEY not found in environment variables")
- 
- self.client = OpenAI(api_key=api_key)
- self.model = model
- self.temperature = temperature
- 
- def classify_business_status(self, business_data: Dict) -> Dict:
- """
- Classify if a business is Active or Inactive based on multiple signals
- 
- Args:
- business_data: Dict containing:
- - name: Business name
- - review_count: Number of reviews
- - last_review_date: Date of most recent review
- - operating_hours: Opening hours text
- - website_status: 200, 404, or None
- - google_rating: Star rating
- - full_reviews: List of all review dicts (optional)
- 
- Returns:
- Dict with classification results
- """
- today = datetime.now().strftime('%Y-%m-%d')
- 
- # Extract recent review text from full_reviews if available
- recent_reviews_text = business_data.get('review_snippets', 'None')
- full_reviews = business_data.get('full_reviews', [])
- if full_reviews:
- # Get last 20 reviews for context
- recent_20 = full_reviews[-20:] if len(full_reviews) > 20 else full_reviews
- recent_reviews_text = "\n".join([
- f"[{r.get('review_datetime_utc', 'N/A')[:10]}] {r.get('review_rating')}: {(r.get('review_text') or '')[:200]}"
- for r in recent_20
- ])
- 
- system_prompt = f"""You are a business analyst. Today is {today}.
-Your task is to determine if a business is currently ACTIVE or INACTIVE (closed/defunct).
+# Google Maps business_status values that settle the status question on their own
+CLOSED_BUSINESS_STATUSES = {'CLOSED_PERMANENTLY', 'CLOSED_TEMPORARILY'}
+
+# Review/website signals clear enough to classify status without the model:
+# a dead website and no reviews for 18 months, or a well-reviewed business
+# with a review in the last month
+INACTIVE_NO_REVIEW_DAYS = 540
+ACTIVE_RECENT_REVIEW_DAYS = 30
+ACTIVE_MIN_REVIEW_COUNT = 50
+
+# JSON mode: the API only returns syntactically valid JSON objects, and
+# requires the word "JSON" to appear in the messages
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+JSON_REPLY_INSTRUCTION = "\n\nRespond with a single JSON object."
+
+# Businesses sent per request by the *_batch methods
+DEFAULT_BATCH_SIZE = 20
 
-ACTIVE indicators:
+# Businesses analyzed at once by aanalyze_business_comprehensive_many
+ASYNC_ANALYSIS_CONCURRENCY = 10
+
+# The SDK retries 429s, 5xx and timeouts with exponential backoff (honoring
+# Retry-After); a few more attempts than its default of 2 rides out bursts
+OPENAI_MAX_RETRIES = 5
+
+# OpenAI Batch API: half-price requests answered within the completion window
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_SECONDS = 60
+BATCH_FAILED_STATUSES = {'failed', 'cancelled'}
+BATCH_DONE_STATUSES = {'completed', 'expired'}
+
+# Keep-alive pool of the process-wide sync client (see get_shared_client)
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Rough request size for the tokens-per-minute limit: ~4 characters per
+# prompt token, plus an allowance for the JSON reply
+CHARS_PER_TOKEN = 4
+ESTIMATED_REPLY_TOKENS = 400
+
+# Result shapes requested from the model (one object per business)
+STATUS_RESULT_SCHEMA = """{
+ "status": "Active/Inactive/Uncertain",
+ "confidence": "High/Medium/Low",
+ "reasoning": "Brief explanation of key signals",
+ "risk_factors": ["List any closure warning signs"]
+}"""
+
+EMPLOYMENT_RESULT_SCHEMA = """{
+ "min_employees": <number>,
+ "max_employees": <number>,
+ "best_estimate": <number>,
+ "confidence": "High/Medium/Low",
+ "reasoning": "Brief explanation"
+}"""
+
+NAICS_RESULT_SCHEMA = """{
+ "is_match": true/false,
+ "confidence": "High/Medium/Low",
+ "actual_naics_suggestion": "6-digit code",
+ "reasoning": "Explanation of classification"
+}"""
+
+# Task guidance shared by the single-task and fused prompts
+STATUS_GUIDELINES = """ACTIVE indicators:
 - Recent reviews (within 6 months)
 - Operating hours listed
 - Website accessible (status 200)
@@ -74,80 +103,7 @@ INACTIVE indicators:
 
 Be conservative: if unclear, classify as "Uncertain"."""
 
- user_prompt = f"""Business: {business_data.get('name', 'Unknown')}
-Review Count: {business_data.get('review_count', 0)}
-Last Review: {business_data.get('last_review_date', 'Never')}
-Hours: {business_data.get('operating_hours', 'Not listed')}
-Website Status: {business_data.get('website_status', 'Unknown')}
-Rating: {business_data.get('google_rating', 'N/A')}
-Recent Reviews:
-{recent_reviews_text}
-
-Return JSON:
-{{
- "status": "Active/Inactive/Uncertain",
- "confidence": "High/Medium/Low",
- "reasoning": "Brief explanation of key signals",
- "risk_factors": ["List any closure warning signs"]
-}}"""
-
- try:
- response = self.client.chat.completions.create(
- model=self.model,
- messages=[
- {"role": "system", "content": system_prompt},
- {"role": "user", "content": user_prompt}
- ],
- temperature=self.temperature
- )
- 
- result = json.loads(
- response.choices[0].message.content
- .replace("```json", "")
- .replace("```", "")
- .strip()
- )
- 
- return result
- 
- except Exception as e:
- return {
- "status": "Error",
- "confidence": "Low",
- "reasoning": f"Analysis failed: {str(e)[:100]}",
- "risk_factors": ["Analysis error"]
- }
- 
- def estimate_employment(self, business_data: Dict) -> Dict:
- """
- Estimate number of employees based on available signals including review analysis
- 
- Args:
- business_data: Dict with business characteristics + full_reviews
- 
- Returns:
- Employment estimate with confidence
- """
- # Extract staff mentions from full reviews if available
- staff_mentions = business_data.get('staff_mentions', 'None')
- full_reviews = business_data.get('full_reviews', [])
- if full_reviews:
- # Sample reviews mentioning staff
- staff_related = []
- keywords = ['staff', 'employee', 'worker', 'bartender', 'waiter', 'barista', 'trainer', 'manager']
- for r in full_reviews:
- text = (r.get('review_text') or '').lower()
- if any(kw in text for kw in keywords):
- staff_related.append(f"[{r.get('review_rating')}] {text[:150]}")
- if len(staff_related) >= 10:
- break
- if staff_related:
- staff_mentions = "\n".join(staff_related)
- 
- system_prompt = """You are an employment analyst.
-Estimate the number of employees based on business characteristics and review content.
-
-Guidelines:
+EMPLOYMENT_GUIDELINES = """Guidelines:
 - Coffee shop: 3-8 employees typically
 - Gym: 10-30 employees typically
 - Library: 5-20 employees typically
@@ -156,144 +112,825 @@ Guidelines:
 
 Provide a range (min-max) and best estimate."""
 
- reviews_per_month = business_data.get('reviews_per_month', 0)
- total_reviews = business_data.get('total_reviews_collected', business_data.get('review_count', 0))
- 
- user_prompt = f"""Business: {business_data.get('name')}
-Type: {business_data.get('category', 'Unknown')}
-Price Level: {business_data.get('price_level', 'Unknown')}
-Operating Hours: {business_data.get('operating_hours', 'Unknown')}
-Total Reviews: {total_reviews}
-Reviews/Month: {reviews_per_month}
-Size Indicators: {business_data.get('size_indicators', 'None')}
+EMPLOYMENT_SYSTEM_PROMPT = f"""You are an employment analyst.
+Estimate the number of employees based on business characteristics and review content.
+
+{EMPLOYMENT_GUIDELINES}"""
+
+# System prompts with the per-call values ({today}, {target_naics},
+# {definition}) filled in last, so every request shares the longest possible
+# identical prefix (eligible for OpenAI's automatic prompt caching)
+STATUS_SYSTEM_PROMPT_TEMPLATE = f"""You are a business analyst.
+Your task is to determine if a business is currently ACTIVE or INACTIVE (closed/defunct).
+
+{STATUS_GUIDELINES}
+
+Today is {{today}}."""
+
+NAICS_SYSTEM_PROMPT_TEMPLATE = """You are a business classification expert.
+Determine if this business truly belongs to the target category.
+
+Target Category: NAICS {target_naics}
+Definition: {definition}"""
+
+FUSED_SYSTEM_PROMPT_TEMPLATE = f"""You are a business analyst.
+Analyze the business in three parts.
+
+status: determine if the business is currently ACTIVE or INACTIVE (closed/defunct).
+{STATUS_GUIDELINES}
+
+employment: estimate the number of employees based on business characteristics and review content.
+{EMPLOYMENT_GUIDELINES}
+
+naics_verification: determine if the business truly belongs to the target category.
+
+Today is {{today}}.
+Target Category: NAICS {{target_naics}}
+Definition: {{definition}}"""
+
+# All three analyses in one object, for the fused single-call prompt
+FUSED_RESULT_SCHEMA = f"""{{
+ "status": {STATUS_RESULT_SCHEMA},
+ "employment": {EMPLOYMENT_RESULT_SCHEMA},
+ "naics_verification": {NAICS_RESULT_SCHEMA}
+}}"""
+FUSED_RESULT_KEYS = ('status', 'employment', 'naics_verification')
+
+# Reviews are the bulk of each prompt, so only a few short snippets are sent:
+# the most recent reviews for status, and reviews mentioning staff for employment
+STATUS_REVIEW_COUNT = 3
+STAFF_MENTION_COUNT = 5
+REVIEW_SNIPPET_CHARS = 160
+# Caller-supplied review text (review_snippets / staff_mentions) gets the same budget
+STATUS_REVIEW_CHARS = STATUS_REVIEW_COUNT * REVIEW_SNIPPET_CHARS
+STAFF_MENTION_CHARS = STAFF_MENTION_COUNT * REVIEW_SNIPPET_CHARS
+
+# Review words that suggest the text talks about employees
+STAFF_KEYWORDS = ['staff', 'employee', 'worker', 'bartender', 'waiter', 'barista', 'trainer', 'manager']
+# One case-insensitive scan per review instead of lower() plus a pass per keyword
+STAFF_KEYWORDS_RE = re.compile('|'.join(map(re.escape, STAFF_KEYWORDS)), re.IGNORECASE)
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(api_key: str) -> OpenAI:
+    """
+    Return the process-wide OpenAI client, creating it on first use.
+
+    Analyzers created per worker or per task then reuse one connection pool
+    instead of each paying for new TCP/TLS handshakes. A different API key
+    gets a client of its own.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.api_key != api_key:
+            _shared_client = OpenAI(
+                api_key=api_key,
+                max_retries=OPENAI_MAX_RETRIES,
+                http_client=DefaultHttpxClient(limits=HTTP_POOL_LIMITS)
+            )
+        return _shared_client
+
+
+class GPTAnalyzer:
+    """
+    Uses GPT-4o-mini to analyze business data and make intelligent classifications
+    """
+
+    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.0, use_cache: bool = True,
+                 rpm: Optional[int] = None, tpm: Optional[int] = None):
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment variables")
+
+        self.client = get_shared_client(api_key)
+        # Used by the a*-prefixed coroutine methods; per instance, because an
+        # async connection pool can't outlive the event loop it was used in
+        self.aclient = AsyncOpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
+        # Optional account limits (requests / tokens per minute) for concurrent
+        # async calls; cache hits don't count against them
+        self._request_rate = AsyncRateLimiter(rpm, 60) if rpm else None
+        self._token_rate = AsyncRateLimiter(tpm, 60) if tpm else None
+        self.model = model
+        self.temperature = temperature
+        # Only deterministic (temperature 0) replies are worth replaying
+        self._response_cache = DiskCache(RESPONSE_CACHE_DIR, enabled=use_cache and temperature == 0)
+
+    def cache_stats(self) -> Dict:
+        """Response cache hits/misses so far (each miss is a paid request)"""
+        return self._response_cache.stats()
+
+    def _request_cache_key(self, system_prompt: str, user_prompt: str) -> str:
+        return make_cache_key('chat', self.model, self.temperature, system_prompt, user_prompt)
+
+    def _chat_request(self, system_prompt: str, user_prompt: str) -> Dict:
+        """Chat completion parameters (also the body of a Batch API line)"""
+        return {
+            'model': self.model,
+            'messages': [
+                {"role": "system", "content": system_prompt + JSON_REPLY_INSTRUCTION},
+                {"role": "user", "content": user_prompt}
+            ],
+            'temperature': self.temperature,
+            'response_format': JSON_RESPONSE_FORMAT
+        }
+
+    def _chat_json(self, system_prompt: str, user_prompt: str, validate: Optional[Callable[[Dict], None]] = None):
+        """
+        Send one chat completion and parse its reply as JSON
+
+        Args:
+            system_prompt: System message
+            user_prompt: User message
+            validate: Check run on the reply before it is cached; raises to reject it
+
+        Returns:
+            Parsed JSON object (served from the disk cache when the same
+            request was answered before)
+        """
+        cache_key = self._request_cache_key(system_prompt, user_prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self.client.chat.completions.create(**self._chat_request(system_prompt, user_prompt))
+
+        result = json_loads(response.choices[0].message.content)
+        if validate:
+            validate(result)
+        self._response_cache.set(cache_key, result)
+        return result
+
+    async def _achat_json(self, system_prompt: str, user_prompt: str,
+                          validate: Optional[Callable[[Dict], None]] = None):
+        """Async _chat_json over the AsyncOpenAI client"""
+        cache_key = self._request_cache_key(system_prompt, user_prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if self._request_rate:
+            await self._request_rate.acquire()
+        if self._token_rate:
+            prompt_tokens = (len(system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN
+            await self._token_rate.acquire(prompt_tokens + ESTIMATED_REPLY_TOKENS)
+
+        response = await self.aclient.chat.completions.create(**self._chat_request(system_prompt, user_prompt))
+
+        result = json_loads(response.choices[0].message.content)
+        if validate:
+            validate(result)
+        self._response_cache.set(cache_key, result)
+        return result
+
+    def _chat_json_batch(self, system_prompt: str, records: List[Dict], result_schema: str,
+                         error_result: Callable[[Exception], Dict], batch_size: int) -> List[Dict]:
+        """
+        Classify many businesses with one request per batch_size records
+
+        Args:
+            system_prompt: System message shared by every batch
+            records: Per-business prompt fields
+            result_schema: JSON shape expected for each business
+            error_result: Builds the fallback result for a failed batch
+            batch_size: Businesses per request
+
+        Returns:
+            One result per record, in the same order
+        """
+        results = []
+        for start in range(0, len(records), batch_size):
+            chunk = records[start:start + batch_size]
+            user_prompt = f"""Businesses:
+{json.dumps(chunk, indent=1, ensure_ascii=False, default=str)}
+
+Return JSON: {{"results": [...]}} with exactly one entry per business, in the same order, each:
+{result_schema}"""
+
+            def check_length(reply, expected=len(chunk)):
+                chunk_results = reply.get('results')
+                if not isinstance(chunk_results, list) or len(chunk_results) != expected:
+                    raise ValueError(f"expected {expected} results, got {len(chunk_results or [])}")
+
+            try:
+                reply = self._chat_json(system_prompt, user_prompt, validate=check_length)
+                results.extend(reply['results'])
+            except Exception as e:
+                results.extend(error_result(e) for _ in chunk)
+        return results
+
+    @staticmethod
+    def _deterministic_status(business_data: Dict) -> Optional[Dict]:
+        """
+        Status result when the signals alone settle it, else None
+
+        Covers businesses Google reports closed and the unambiguous
+        review/website cases, so they need no GPT call.
+        """
+        google_status = business_data.get('business_status')
+        if google_status in CLOSED_BUSINESS_STATUSES:
+            return {
+                "status": "Inactive",
+                "confidence": "High",
+                "reasoning": f"Google Maps reports business status {google_status}",
+                "risk_factors": [google_status]
+            }
+
+        last_review = business_data.get('last_review_date')
+        days = days_since_last_review(last_review) if isinstance(last_review, str) else None
+        if days is None:
+            return None
+
+        if str(business_data.get('website_status')) == '404' and days > INACTIVE_NO_REVIEW_DAYS:
+            return {
+                "status": "Inactive",
+                "confidence": "High",
+                "reasoning": f"Website returns 404 and the last review was {days} days ago",
+                "risk_factors": ["Website 404 error", f"No reviews in {days} days"]
+            }
+
+        try:
+            review_count = int(business_data.get('review_count') or 0)
+        except (TypeError, ValueError):
+            review_count = 0
+        if review_count > ACTIVE_MIN_REVIEW_COUNT and days < ACTIVE_RECENT_REVIEW_DAYS:
+            return {
+                "status": "Active",
+                "confidence": "High",
+                "reasoning": f"{review_count} reviews, the latest {days} days ago",
+                "risk_factors": []
+            }
+        return None
+
+    @staticmethod
+    def _clip_text(text, max_chars: int):
+        """Cut text longer than max_chars at a word boundary; non-strings pass through"""
+        if not isinstance(text, str) or len(text) <= max_chars:
+            return text
+        return text[:max_chars].rsplit(' ', 1)[0] + " ..."
+
+    @staticmethod
+    def _status_error(e: Exception) -> Dict:
+        return {
+            "status": "Error",
+            "confidence": "Low",
+            "reasoning": f"Analysis failed: {str(e)[:100]}",
+            "risk_factors": ["Analysis error"]
+        }
+
+    @staticmethod
+    def _employment_error(e: Exception) -> Dict:
+        return {
+            "min_employees": None,
+            "max_employees": None,
+            "best_estimate": None,
+            "confidence": "Low",
+            "reasoning": f"Estimation failed: {str(e)[:100]}"
+        }
+
+    @staticmethod
+    def _naics_error(e: Exception) -> Dict:
+        return {
+            "is_match": None,
+            "confidence": "Low",
+            "actual_naics_suggestion": None,
+            "reasoning": f"Classification failed: {str(e)[:100]}"
+        }
+
+    def _status_system_prompt(self) -> str:
+        return STATUS_SYSTEM_PROMPT_TEMPLATE.format(today=datetime.now().strftime('%Y-%m-%d'))
+
+    def _status_record(self, business_data: Dict) -> Dict:
+        """Prompt fields for the status classifier"""
+        # Extract recent review text from full_reviews if available
+        recent_reviews_text = self._clip_text(business_data.get('review_snippets', 'None'), STATUS_REVIEW_CHARS)
+        full_reviews = business_data.get('full_reviews', [])
+        if full_reviews:
+            # Dates carry most of the recency signal; a few short snippets are enough context
+            recent_reviews_text = "\n".join([
+                f"[{r.get('review_datetime_utc', 'N/A')[:10]}] {r.get('review_rating')}: "
+                f"{(r.get('review_text') or '')[:REVIEW_SNIPPET_CHARS]}"
+                for r in full_reviews[-STATUS_REVIEW_COUNT:]
+            ])
+
+        return {
+            "name": business_data.get('name', 'Unknown'),
+            "review_count": business_data.get('review_count', 0),
+            "last_review": business_data.get('last_review_date', 'Never'),
+            "hours": business_data.get('operating_hours', 'Not listed'),
+            "website_status": business_data.get('website_status', 'Unknown'),
+            "rating": business_data.get('google_rating', 'N/A'),
+            "recent_reviews": recent_reviews_text
+        }
+
+    def _status_user_prompt(self, business_data: Dict) -> str:
+        record = self._status_record(business_data)
+        return f"""Business: {record['name']}
+Review Count: {record['review_count']}
+Last Review: {record['last_review']}
+Hours: {record['hours']}
+Website Status: {record['website_status']}
+Rating: {record['rating']}
+Recent Reviews:
+{record['recent_reviews']}
+
+Return JSON:
+{STATUS_RESULT_SCHEMA}"""
+
+    def _employment_record(self, business_data: Dict) -> Dict:
+        """Prompt fields for the employment estimator"""
+        # Extract staff mentions from full reviews if available
+        staff_mentions = self._clip_text(business_data.get('staff_mentions', 'None'), STAFF_MENTION_CHARS)
+        full_reviews = business_data.get('full_reviews', [])
+        if full_reviews:
+            # Sample reviews mentioning staff
+            staff_related = []
+            for r in full_reviews:
+                text = r.get('review_text') or ''
+                if STAFF_KEYWORDS_RE.search(text):
+                    staff_related.append(f"[{r.get('review_rating')}] {text[:REVIEW_SNIPPET_CHARS].lower()}")
+                    if len(staff_related) >= STAFF_MENTION_COUNT:
+                        break
+            if staff_related:
+                staff_mentions = "\n".join(staff_related)
+
+        return {
+            "name": business_data.get('name'),
+            "type": business_data.get('category', 'Unknown'),
+            "price_level": business_data.get('price_level', 'Unknown'),
+            "operating_hours": business_data.get('operating_hours', 'Unknown'),
+            "total_reviews": business_data.get('total_reviews_collected', business_data.get('review_count', 0)),
+            "reviews_per_month": business_data.get('reviews_per_month', 0),
+            "size_indicators": business_data.get('size_indicators', 'None'),
+            "staff_mentions": staff_mentions
+        }
+
+    def _employment_user_prompt(self, business_data: Dict) -> str:
+        record = self._employment_record(business_data)
+        return f"""Business: {record['name']}
+Type: {record['type']}
+Price Level: {record['price_level']}
+Operating Hours: {record['operating_hours']}
+Total Reviews: {record['total_reviews']}
+Reviews/Month: {record['reviews_per_month']}
+Size Indicators: {record['size_indicators']}
 Staff Mentions in Reviews:
-{staff_mentions}
+{record['staff_mentions']}
 
 Return JSON:
-{{
- "min_employees": <number>,
- "max_employees": <number>,
- "best_estimate": <number>,
- "confidence": "High/Medium/Low",
- "reasoning": "Brief explanation"
-}}"""
+{EMPLOYMENT_RESULT_SCHEMA}"""
 
- try:
- response = self.client.chat.completions.create(
- model=self.model,
- messages=[
- {"role": "system", "content": system_prompt},
- {"role": "user", "content": user_prompt}
- ],
- temperature=self.temperature
- )
- 
- result = json.loads(
- response.choices[0].message.content
- .replace("```json", "")
- .replace("```", "")
- .strip()
- )
- 
- return result
- 
- except Exception as e:
- return {
- "min_employees": None,
- "max_employees": None,
- "best_estimate": None,
- "confidence": "Low",
- "reasoning": f"Estimation failed: {str(e)[:100]}"
- }
- 
- def verify_naics_classification(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
- """
- Verify if a business matches the target NAICS classification
- 
- Args:
- business_data: Business characteristics
- target_naics: Expected NAICS code
- definition: NAICS category definition
- 
- Returns:
- Verification result
- """
- system_prompt = f"""You are a business classification expert.
-Target Category: NAICS {target_naics}
-Definition: {definition}
+    def _naics_system_prompt(self, target_naics: str, definition: str) -> str:
+        return NAICS_SYSTEM_PROMPT_TEMPLATE.format(target_naics=target_naics, definition=definition)
 
-Determine if this business truly belongs to this category."""
+    def _naics_record(self, business_data: Dict) -> Dict:
+        """Prompt fields for the NAICS verifier"""
+        # Sorted and joined so the same types always render the same prompt
+        # (and hit the same response cache entry)
+        google_types = business_data.get('google_types') or []
+        if not isinstance(google_types, str):
+            google_types = ", ".join(sorted(map(str, google_types))) or 'Unknown'
+        return {
+            "name": business_data.get('name'),
+            "google_category": google_types,
+            "operating_hours": business_data.get('operating_hours', 'Unknown'),
+            "attributes": business_data.get('attributes', 'Unknown'),
+            "review_keywords": business_data.get('review_keywords', 'None')
+        }
 
- user_prompt = f"""Business: {business_data.get('name')}
-Google Category: {business_data.get('google_types', [])}
-Operating Hours: {business_data.get('operating_hours', 'Unknown')}
-Attributes: {business_data.get('attributes', 'Unknown')}
-Review Keywords: {business_data.get('review_keywords', 'None')}
+    def _naics_user_prompt(self, business_data: Dict, target_naics: str) -> str:
+        record = self._naics_record(business_data)
+        return f"""Business: {record['name']}
+Google Category: {record['google_category']}
+Operating Hours: {record['operating_hours']}
+Attributes: {record['attributes']}
+Review Keywords: {record['review_keywords']}
 
 Does this match NAICS {target_naics}?
 
 Return JSON:
-{{
- "is_match": true/false,
- "confidence": "High/Medium/Low",
- "actual_naics_suggestion": "6-digit code",
- "reasoning": "Explanation of classification"
-}}"""
+{NAICS_RESULT_SCHEMA}"""
+
+    def classify_business_status(self, business_data: Dict) -> Dict:
+        """
+        Classify if a business is Active or Inactive based on multiple signals
+
+        Args:
+            business_data: Dict containing:
+                - name: Business name
+                - review_count: Number of reviews
+                - last_review_date: Date of most recent review
+                - operating_hours: Opening hours text
+                - website_status: 200, 404, or None
+                - google_rating: Star rating
+                - full_reviews: List of all review dicts (optional)
+                - business_status: Google Maps business_status (optional)
+
+        Returns:
+            Dict with classification results
+        """
+        # Google's closed status or clear review signals settle it; skip the GPT call
+        decided = self._deterministic_status(business_data)
+        if decided:
+            return decided
+
+        try:
+            return self._chat_json(self._status_system_prompt(), self._status_user_prompt(business_data))
+        except Exception as e:
+            return self._status_error(e)
+
+    def estimate_employment(self, business_data: Dict) -> Dict:
+        """
+        Estimate number of employees based on available signals including review analysis
+
+        Args:
+            business_data: Dict with business characteristics + full_reviews
+
+        Returns:
+            Employment estimate with confidence
+        """
+        try:
+            return self._chat_json(EMPLOYMENT_SYSTEM_PROMPT, self._employment_user_prompt(business_data))
+        except Exception as e:
+            return self._employment_error(e)
+
+    def verify_naics_classification(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """
+        Verify if a business matches the target NAICS classification
+
+        Args:
+            business_data: Business characteristics
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+
+        Returns:
+            Verification result
+        """
+        try:
+            return self._chat_json(
+                self._naics_system_prompt(target_naics, definition),
+                self._naics_user_prompt(business_data, target_naics)
+            )
+        except Exception as e:
+            return self._naics_error(e)
+
+    def _fused_system_prompt(self, target_naics: str, definition: str) -> str:
+        return FUSED_SYSTEM_PROMPT_TEMPLATE.format(
+            today=datetime.now().strftime('%Y-%m-%d'),
+            target_naics=target_naics,
+            definition=definition
+        )
+
+    def _fused_user_prompt(self, business_data: Dict, target_naics: str) -> str:
+        # Every field is rendered once, however many parts read it
+        status = self._status_record(business_data)
+        employment = self._employment_record(business_data)
+        naics = self._naics_record(business_data)
+        return f"""Business: {status['name']}
+Type: {employment['type']}
+Google Category: {naics['google_category']}
+Price Level: {employment['price_level']}
+Operating Hours: {employment['operating_hours']}
+Website Status: {status['website_status']}
+Rating: {status['rating']}
+Review Count: {status['review_count']}
+Total Reviews: {employment['total_reviews']}
+Reviews/Month: {employment['reviews_per_month']}
+Last Review: {status['last_review']}
+Size Indicators: {employment['size_indicators']}
+Attributes: {naics['attributes']}
+Review Keywords: {naics['review_keywords']}
+Recent Reviews:
+{status['recent_reviews']}
+Staff Mentions in Reviews:
+{employment['staff_mentions']}
+
+Does this match NAICS {target_naics}?
+
+Return JSON:
+{FUSED_RESULT_SCHEMA}"""
+
+    @staticmethod
+    def _check_fused_reply(reply: Dict) -> None:
+        missing = [key for key in FUSED_RESULT_KEYS if not isinstance(reply.get(key), dict)]
+        if missing:
+            raise ValueError(f"reply missing {', '.join(missing)}")
+
+    def _fused_result(self, business_data: Dict, reply: Optional[Dict], error: Optional[Exception]) -> Dict:
+        """Shape a fused reply (or failure) like analyze_business_comprehensive"""
+        if error is not None:
+            result = {
+                'status': self._status_error(error),
+                'employment': self._employment_error(error),
+                'naics_verification': self._naics_error(error)
+            }
+        else:
+            result = {key: reply[key] for key in FUSED_RESULT_KEYS}
+        # Google's closed status and clear review signals still override the model
+        decided = self._deterministic_status(business_data)
+        if decided:
+            result['status'] = decided
+        return result
 
- try:
- response = self.client.chat.completions.create(
- model=self.model,
- messages=[
- {"role": "system", "content": system_prompt},
- {"role": "user", "content": user_prompt}
- ],
- temperature=self.temperature
- )
- 
- result = json.loads(
- response.choices[0].message.content
- .replace("```json", "")
- .replace("```", "")
- .strip()
- )
- 
- return result
- 
- except Exception as e:
- return {
- "is_match": None,
- "confidence": "Low",
- "actual_naics_suggestion": None,
- "reasoning": f"Classification failed: {str(e)[:100]}"
- }
- 
- def analyze_business_comprehensive(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
- """
- Comprehensive analysis combining all GPT capabilities
- 
- Returns:
- Complete business analysis
- """
- return {
- 'status': self.classify_business_status(business_data),
- 'employment': self.estimate_employment(business_data),
- 'naics_verification': self.verify_naics_classification(business_data, target_naics, definition)
- }
+    def analyze_business_fused(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """
+        Status, employment and NAICS verification from a single chat call
+
+        The business fields and the task preamble are sent once instead of
+        three times, so the analysis costs one round trip and fewer tokens.
+
+        Args:
+            business_data: Business characteristics (see classify_business_status)
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+
+        Returns:
+            Complete business analysis
+        """
+        try:
+            reply = self._chat_json(
+                self._fused_system_prompt(target_naics, definition),
+                self._fused_user_prompt(business_data, target_naics),
+                validate=self._check_fused_reply
+            )
+        except Exception as e:
+            return self._fused_result(business_data, None, e)
+        return self._fused_result(business_data, reply, None)
+
+    async def aanalyze_business_fused(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """Async analyze_business_fused"""
+        try:
+            reply = await self._achat_json(
+                self._fused_system_prompt(target_naics, definition),
+                self._fused_user_prompt(business_data, target_naics),
+                validate=self._check_fused_reply
+            )
+        except Exception as e:
+            return self._fused_result(business_data, None, e)
+        return self._fused_result(business_data, reply, None)
+
+    def analyze_business_comprehensive(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """
+        Comprehensive analysis combining all GPT capabilities
+
+        Runs as one fused request (see analyze_business_fused).
+
+        Returns:
+            Complete business analysis
+        """
+        return self.analyze_business_fused(business_data, target_naics, definition)
+
+    async def aclassify_business_status(self, business_data: Dict) -> Dict:
+        """Async classify_business_status"""
+        decided = self._deterministic_status(business_data)
+        if decided:
+            return decided
+
+        try:
+            return await self._achat_json(self._status_system_prompt(), self._status_user_prompt(business_data))
+        except Exception as e:
+            return self._status_error(e)
+
+    async def aestimate_employment(self, business_data: Dict) -> Dict:
+        """Async estimate_employment"""
+        try:
+            return await self._achat_json(EMPLOYMENT_SYSTEM_PROMPT, self._employment_user_prompt(business_data))
+        except Exception as e:
+            return self._employment_error(e)
+
+    async def averify_naics_classification(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """Async verify_naics_classification"""
+        try:
+            return await self._achat_json(
+                self._naics_system_prompt(target_naics, definition),
+                self._naics_user_prompt(business_data, target_naics)
+            )
+        except Exception as e:
+            return self._naics_error(e)
+
+    async def aanalyze_business_comprehensive(self, business_data: Dict, target_naics: str, definition: str) -> Dict:
+        """
+        Async analyze_business_comprehensive (one fused request)
+
+        Returns:
+            Complete business analysis
+        """
+        return await self.aanalyze_business_fused(business_data, target_naics, definition)
+
+    async def aanalyze_business_comprehensive_many(self, businesses: List[Dict], target_naics: str, definition: str,
+                                                   concurrency: int = ASYNC_ANALYSIS_CONCURRENCY) -> List[Dict]:
+        """
+        aanalyze_business_comprehensive for many businesses concurrently
+
+        Requests are throttled to the analyzer's rpm/tpm limits, and failures
+        are retried by the OpenAI client. Every reply is cached on disk, so a
+        run that is interrupted resumes without re-paying for finished work.
+
+        Args:
+            businesses: business_data dicts
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+            concurrency: Businesses analyzed at once (one request each)
+
+        Returns:
+            Complete business analyses in the same order as businesses
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def analyze(business_data):
+            async with semaphore:
+                return await self.aanalyze_business_comprehensive(business_data, target_naics, definition)
+
+        return list(await asyncio.gather(*(analyze(b) for b in businesses)))
+
+    def submit_batch(self, businesses: List[Dict], target_naics: str, definition: str) -> str:
+        """
+        Queue analyze_business_comprehensive for many businesses on the Batch API
+
+        Batch requests cost half as much and draw on a separate rate limit,
+        but are answered within 24h; use for full-dataset sweeps.
+
+        Args:
+            businesses: business_data dicts
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+
+        Returns:
+            Batch id for retrieve_batch
+        """
+        system_prompt = self._fused_system_prompt(target_naics, definition)
+        lines = [
+            json.dumps({
+                'custom_id': f"{i}:comprehensive",
+                'method': 'POST',
+                'url': BATCH_ENDPOINT,
+                'body': self._chat_request(system_prompt, self._fused_user_prompt(b, target_naics))
+            }, ensure_ascii=False, default=str)
+            for i, b in enumerate(businesses)
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        return batch.id
+
+    def retrieve_batch(self, batch_id: str, businesses: List[Dict], target_naics: str, definition: str,
+                       wait: bool = False, poll_seconds: float = BATCH_POLL_SECONDS) -> Optional[List[Dict]]:
+        """
+        Collect the results of a submit_batch call
+
+        Replies are written to the response cache, so later synchronous
+        analyses of the same businesses are served without a request.
+
+        Args:
+            batch_id: Id returned by submit_batch
+            businesses: The businesses passed to submit_batch, in the same order
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+            wait: Poll until the batch finishes instead of returning None
+            poll_seconds: Seconds between status checks when waiting
+
+        Returns:
+            Complete business analyses in the same order as businesses, or
+            None while the batch is still running
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in BATCH_DONE_STATUSES:
+            if batch.status in BATCH_FAILED_STATUSES:
+                raise RuntimeError(f"Batch {batch_id} {batch.status}")
+            if not wait:
+                return None
+            time.sleep(poll_seconds)
+            batch = self.client.batches.retrieve(batch_id)
+
+        # An expired batch still returns the requests it finished
+        replies = {}
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if line.strip():
+                    entry = json_loads(line)
+                    replies[entry['custom_id']] = entry
+
+        system_prompt = self._fused_system_prompt(target_naics, definition)
+        results = []
+        for i, business_data in enumerate(businesses):
+            entry = replies.get(f"{i}:comprehensive")
+            try:
+                if entry is None or entry.get('error') or entry['response']['status_code'] != 200:
+                    raise RuntimeError((entry or {}).get('error') or "no batch result")
+                reply = json_loads(entry['response']['body']['choices'][0]['message']['content'])
+                self._check_fused_reply(reply)
+            except Exception as e:
+                results.append(self._fused_result(business_data, None, e))
+                continue
+            user_prompt = self._fused_user_prompt(business_data, target_naics)
+            self._response_cache.set(self._request_cache_key(system_prompt, user_prompt), reply)
+            results.append(self._fused_result(business_data, reply, None))
+        return results
+
+    def classify_business_status_batch(self, businesses: List[Dict],
+                                       batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
+        """
+        classify_business_status for many businesses, batch_size per request
+
+        Businesses whose status the signals settle (see _deterministic_status)
+        are answered without a call.
+
+        Args:
+            businesses: business_data dicts (see classify_business_status)
+            batch_size: Businesses per request
+
+        Returns:
+            Status results in the same order as businesses
+        """
+        results = [self._deterministic_status(b) for b in businesses]
+        pending = [i for i, result in enumerate(results) if result is None]
+        fetched = self._chat_json_batch(
+            self._status_system_prompt(),
+            [self._status_record(businesses[i]) for i in pending],
+            STATUS_RESULT_SCHEMA, self._status_error, batch_size
+        )
+        for i, result in zip(pending, fetched):
+            results[i] = result
+        return results
+
+    def estimate_employment_batch(self, businesses: List[Dict],
+                                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
+        """
+        estimate_employment for many businesses, batch_size per request
+
+        Args:
+            businesses: business_data dicts (see estimate_employment)
+            batch_size: Businesses per request
+
+        Returns:
+            Employment estimates in the same order as businesses
+        """
+        return self._chat_json_batch(
+            EMPLOYMENT_SYSTEM_PROMPT,
+            [self._employment_record(b) for b in businesses],
+            EMPLOYMENT_RESULT_SCHEMA, self._employment_error, batch_size
+        )
+
+    def verify_naics_classification_batch(self, businesses: List[Dict], target_naics: str, definition: str,
+                                          batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
+        """
+        verify_naics_classification for many businesses, batch_size per request
+
+        Args:
+            businesses: business_data dicts
+            target_naics: Expected NAICS code
+            definition: NAICS category definition
+            batch_size: Businesses per request
+
+        Returns:
+            Verification results in the same order as businesses
+        """
+        return self._chat_json_batch(
+            self._naics_system_prompt(target_naics, definition),
+            [self._naics_record(b) for b in businesses],
+            NAICS_RESULT_SCHEMA, self._naics_error, batch_size
+        )
+
+    def analyze_business_comprehensive_batch(self, businesses: List[Dict], target_naics: str, definition: str,
+                                             batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
+        """
+        analyze_business_comprehensive for many businesses
+
+        Makes three batched calls per batch_size businesses instead of three
+        calls per business.
+
+        Returns:
+            Complete business analyses in the same order as businesses
+        """
+        statuses = self.classify_business_status_batch(businesses, batch_size)
+        employment = self.estimate_employment_batch(businesses, batch_size)
+        naics = self.verify_naics_classification_batch(businesses, target_naics, definition, batch_size)
+        return [
+            {'status': s, 'employment': e, 'naics_verification': n}
+            for s, e, n in zip(statuses, employment, naics)
+        ]
 
 
 # Example usage
 if __name__ == "__main__":
- analyzer = GPTAnalyzer()
- 
- test_business = {
- 'name': 'Spyhouse Coffee',
- 'review_count': 245,
- 'last_review_date': '2026-01-15',
- 'operating_hours': 'Mon-Fri: 6AM-6PM, Sat-Sun: 7AM-5PM',
- 'website_status': 200,
- 'google_rating': 4.5,
- 'review_snippets': 'Great espresso! ... Love this place ... Best coffee in town'
- }
- 
- status = analyzer.classify_business_status(test_business)
- print(f"Status Analysis: {status}")
+    analyzer = GPTAnalyzer()
+
+    test_business = {
+        'name': 'Spyhouse Coffee',
+        'review_count': 245,
+        'last_review_date': '2026-01-15',
+        'operating_hours': 'Mon-Fri: 6AM-6PM, Sat-Sun: 7AM-5PM',
+        'website_status': 200,
+        'google_rating': 4.5,
+        'review_snippets': 'Great espresso! ... Love this place ... Best coffee in town'
+    }
+
+    status = analyzer.classify_business_status(test_business)
+    print(f"Status Analysis: {status}")
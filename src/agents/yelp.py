@@ -1,97 +1,135 @@
 import requests
 import os
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.cache import CACHE_DIR, DiskCache, make_cache_key
 
 # Load API Key
 load_dotenv()
 API_KEY = os.getenv("YELP_API_KEY")
 
+# Search and business detail responses, reused for a week
+RESPONSE_CACHE_DIR = CACHE_DIR / "yelp"
+REQUEST_TIMEOUT = 10
+
+# Pooled keep-alive connections; transient errors and 429s are retried by urllib3
+RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False
+)
+
 class YelpAgent:
- def __init__(self):
- if not API_KEY:
- print("Warning: YELP_API_KEY is missing in .env")
- self.headers = None
- else:
- self.headers = {'Authorization': f'Bearer {API_KEY}'}
- self.base_url = "https://api.yelp.com/v3/businesses"
-
- def search_businesses(self, term, location=None, latitude=None, longitude=None, limit=50, offset=0, radius=2000):
- """
- Search Yelp for businesses.
- 
- Args:
- term (str): Search term
- location (str): Location text (optional)
- latitude (float): Latitude (optional)
- longitude (float): Longitude (optional)
- limit (int): Max results per call (<=50)
- offset (int): Pagination offset
- radius (int): Search radius in meters (<=40000)
- """
- if not self.headers:
- return []
-
- url = f"{self.base_url}/search"
- params = {
- 'term': term,
- 'limit': min(limit, 50),
- 'offset': offset,
- 'radius': min(radius, 40000)
- }
- if location:
- params['location'] = location
- if latitude and longitude:
- params['latitude'] = latitude
- params['longitude'] = longitude
-
- try:
- response = requests.get(url, headers=self.headers, params=params)
- if response.status_code == 200:
- return response.json().get('businesses', [])
- else:
- print(f"Yelp Error {response.status_code}: {response.text}")
- return []
- except Exception as e:
- print(f"Error calling Yelp: {e}")
- return []
-
- def get_business_details(self, yelp_id):
- """
- Get detailed info (categories, hours, etc.)
- """
- if not self.headers:
- return {}
-
- url = f"{self.base_url}/{yelp_id}"
- try:
- response = requests.get(url, headers=self.headers)
- if response.status_code == 200:
- return response.json()
- else:
- return {}
- except Exception as e:
- print(f"Error getting details: {e}")
- return {}
-
- def get_reviews(self, yelp_id):
- """
- Get Yelp reviews (Yelp API returns up to 3 reviews).
- """
- if not self.headers:
- return []
-
- url = f"{self.base_url}/{yelp_id}/reviews"
- try:
- response = requests.get(url, headers=self.headers)
- if response.status_code == 200:
- return response.json().get('reviews', [])
- return []
- except Exception as e:
- print(f"Error getting reviews: {e}")
- return []
+    def __init__(self, use_cache=True):
+        if not API_KEY:
+            print("Warning: YELP_API_KEY is missing in .env")
+            self.headers = None
+        else:
+            self.headers = {'Authorization': f'Bearer {API_KEY}'}
+        self.session = requests.Session()
+        if self.headers:
+            self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=RETRY_POLICY)
+        self.session.mount('https://', adapter)
+        self.base_url = "https://api.yelp.com/v3/businesses"
+        self._response_cache = DiskCache(RESPONSE_CACHE_DIR, enabled=use_cache)
+
+    def search_businesses(self, term, location=None, latitude=None, longitude=None, limit=50, offset=0, radius=2000):
+        """
+        Search Yelp for businesses.
+        Non-empty results are cached on disk by request parameters.
+
+        Args:
+            term (str): Search term
+            location (str): Location text (optional)
+            latitude (float): Latitude (optional)
+            longitude (float): Longitude (optional)
+            limit (int): Max results per call (<=50)
+            offset (int): Pagination offset
+            radius (int): Search radius in meters (<=40000)
+        """
+        if not self.headers:
+            return []
+
+        url = f"{self.base_url}/search"
+        params = {
+            'term': term,
+            'limit': min(limit, 50),
+            'offset': offset,
+            'radius': min(radius, 40000)
+        }
+        if location:
+            params['location'] = location
+        if latitude and longitude:
+            params['latitude'] = latitude
+            params['longitude'] = longitude
+
+        cache_key = make_cache_key('search', params)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 200:
+                businesses = response.json().get('businesses', [])
+                if businesses:
+                    self._response_cache.set(cache_key, businesses)
+                return businesses
+            else:
+                print(f"Yelp Error {response.status_code}: {response.text}")
+                return []
+        except Exception as e:
+            print(f"Error calling Yelp: {e}")
+            return []
+
+    def get_business_details(self, yelp_id):
+        """
+        Get detailed info (categories, hours, etc.)
+        """
+        if not self.headers:
+            return {}
+
+        url = f"{self.base_url}/{yelp_id}"
+        cache_key = make_cache_key('details', yelp_id)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 200:
+                details = response.json()
+                self._response_cache.set(cache_key, details)
+                return details
+            else:
+                return {}
+        except Exception as e:
+            print(f"Error getting details: {e}")
+            return {}
+
+    def get_reviews(self, yelp_id):
+        """
+        Get Yelp reviews (Yelp API returns up to 3 reviews).
+        """
+        if not self.headers:
+            return []
+
+        url = f"{self.base_url}/{yelp_id}/reviews"
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 200:
+                return response.json().get('reviews', [])
+            return []
+        except Exception as e:
+            print(f"Error getting reviews: {e}")
+            return []
 
 # Test
 if __name__ == "__main__":
- agent = YelpAgent()
- results = agent.search_businesses("Starbucks", "Boulder, CO")
- print(f"Found {len(results)} shops on Yelp.")
\ No newline at end of file
+    agent = YelpAgent()
+    results = agent.search_businesses("Starbucks", "Boulder, CO")
+    print(f"Found {len(results)} shops on Yelp.")
@@ -7,26 +7,56 @@ Industry filtering by NAICS codes
 
 import pandas as pd
 import geopandas as gpd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Column dtypes for reading the NETS CSV. Low-cardinality text columns are
+# categorical so ZIP/state filters compare integer codes, not strings.
+NETS_CSV_DTYPES = {
+    'duns_id': str,
+    'naics_code': str,
+    'zip_code': 'category',
+    'state': 'category',
+    'city': 'category',
+    'latitude': float,
+    'longitude': float
+}
+
+# Arrow equivalents of NETS_CSV_DTYPES for the fast_io reader; dictionary
+# columns arrive in pandas as categoricals with string categories
+NETS_ARROW_TYPES = {
+    col: {
+        str: pa.string(),
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        float: pa.float64()
+    }[dtype]
+    for col, dtype in NETS_CSV_DTYPES.items()
+}
+
 
 class NETSLoader:
     """Load and process NETS business establishment data"""
     
-    def __init__(self, nets_csv_path: str, target_state: str = "MN"):
+    def __init__(self, nets_csv_path: str, target_state: str = "MN", fast_io: bool = False):
         """
         Initialize NETS data loader
         
         Args:
-            nets_csv_path: Path to NETS establishments CSV file
+            nets_csv_path: Path to NETS establishments CSV file (or a typed
+                .parquet copy of it, read without any CSV parsing)
             target_state: State abbreviation filter (default: MN)
+            fast_io: Parse the CSV with the multithreaded PyArrow engine
         """
         self.nets_csv_path = nets_csv_path
         self.target_state = target_state
+        self.fast_io = fast_io
         self.df = None
         self.logger = logging.getLogger(__name__)
         
@@ -46,15 +76,18 @@ class NETSLoader:
             - year_established, year_closed (if applicable)
             - employee_count (may be imputed)
         """
+        engine = 'pyarrow' if self.fast_io else 'c'
         try:
-            self.df = pd.read_csv(self.nets_csv_path, dtype={
-                'duns_id': str,
-                'naics_code': str,
-                'zip_code': str,
-                'latitude': float,
-                'longitude': float
-            })
-            self.logger.info(f"Loaded {len(self.df)} NETS records from {self.nets_csv_path}")
+            if self._is_parquet():
+                engine = 'parquet'
+                self.df = pd.read_parquet(self.nets_csv_path, engine='pyarrow')
+            elif self.fast_io:
+                self.df = self._read_csv_arrow()
+            else:
+                self.df = pd.read_csv(self.nets_csv_path, engine=engine, dtype=NETS_CSV_DTYPES)
+            self.logger.info(
+                f"Loaded {len(self.df)} NETS records from {self.nets_csv_path} (engine={engine})"
+            )
             return self.df
         except FileNotFoundError:
             self.logger.error(f"NETS file not found: {self.nets_csv_path}")
@@ -63,6 +96,137 @@ class NETSLoader:
             self.logger.error(f"Error loading NETS data: {e}")
             raise
     
+    def _is_parquet(self) -> bool:
+        """Whether the input is a Parquet file rather than a CSV"""
+        return Path(self.nets_csv_path).suffix.lower() == '.parquet'
+    
+    def _iter_chunks(self, chunksize: int):
+        """
+        Yield the input as DataFrames of at most chunksize rows
+        
+        Args:
+            chunksize: Rows per chunk
+            
+        Yields:
+            DataFrame chunks with NETS_CSV_DTYPES applied
+        """
+        if self._is_parquet():
+            parquet_file = pq.ParquetFile(self.nets_csv_path)
+            offset = 0
+            try:
+                for batch in parquet_file.iter_batches(batch_size=chunksize):
+                    # Number rows across batches like the CSV chunk reader does
+                    chunk = batch.to_pandas()
+                    chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                    offset += len(chunk)
+                    yield chunk
+            finally:
+                parquet_file.close()
+        else:
+            with pd.read_csv(self.nets_csv_path, chunksize=chunksize, dtype=NETS_CSV_DTYPES) as reader:
+                yield from reader
+    
+    def _read_csv_arrow(self) -> pd.DataFrame:
+        """
+        Parse the CSV with the multithreaded PyArrow reader
+        
+        Arrow buffers are released column by column while converting
+        (self_destruct), so peak memory stays near one copy of the data.
+        
+        Returns:
+            DataFrame with the same dtypes as the pandas reader
+        """
+        table = pa_csv.read_csv(
+            self.nets_csv_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=NETS_ARROW_TYPES,
+                strings_can_be_null=True
+            )
+        )
+        # All-empty columns parse as Arrow null; pandas reads them as float NaN
+        for i, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+    
+    def load_filtered_chunks(
+        self,
+        naics_codes: List[str],
+        zip_codes: Optional[List[str]] = None,
+        chunksize: int = 200_000,
+        max_records: Optional[int] = None,
+        active_only: bool = False
+    ) -> pd.DataFrame:
+        """
+        Stream the NETS CSV in chunks, keeping only matching NAICS/ZIP rows
+        
+        Peak memory is bounded by the chunk size rather than the file size,
+        since most rows are discarded by the industry and ZIP filters.
+        
+        Args:
+            naics_codes: NAICS codes to keep (6-digit prefix match)
+            zip_codes: ZIP codes to keep (optional)
+            chunksize: Rows per chunk
+            max_records: Keep the first this many matching rows (in file
+                order) and stop reading there
+            active_only: Also apply the active-establishment filter per chunk
+            
+        Returns:
+            DataFrame with the matching records
+        """
+        # Sets are hashed once here rather than per chunk inside isin
+        naics_codes = frozenset(str(code) for code in naics_codes)
+        zip_codes = frozenset(str(z) for z in zip_codes) if zip_codes else None
+        
+        kept = []
+        empty_frame = pd.DataFrame()
+        total = 0
+        kept_count = 0
+        try:
+            reader = self._iter_chunks(chunksize)
+            for chunk in reader:
+                if total == 0:
+                    # Keep the column layout in case nothing matches
+                    empty_frame = chunk.iloc[:0]
+                total += len(chunk)
+                mask = chunk['naics_code'].str[:6].isin(naics_codes)
+                if zip_codes:
+                    mask &= chunk['zip_code'].isin(zip_codes)
+                if active_only:
+                    mask &= self._active_mask(chunk)
+                matches = int(mask.sum())
+                if matches:
+                    kept.append(chunk[mask])
+                    kept_count += matches
+                if max_records and kept_count >= max_records:
+                    reader.close()
+                    break
+        except FileNotFoundError:
+            self.logger.error(f"NETS file not found: {self.nets_csv_path}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Error loading NETS data: {e}")
+            raise
+        
+        self.df = pd.concat(kept) if kept else empty_frame
+        # Chunks infer their own categories, so concat falls back to object
+        categorical_cols = {
+            col: 'category' for col, dtype in NETS_CSV_DTYPES.items()
+            if dtype == 'category' and col in self.df.columns
+        }
+        self.df = self.df.astype(categorical_cols)
+        if max_records:
+            self.df = self.df.head(max_records)
+        # Same derived column filter_by_naics_codes adds
+        if 'naics_code' in self.df.columns:
+            self.df = self.df.assign(naics_6digit=self.df['naics_code'].str[:6])
+        self.logger.info(
+            f"Streamed {total} NETS records from {self.nets_csv_path} "
+            f"(chunksize={chunksize}), kept {len(self.df)}"
+        )
+        return self.df
+    
     def filter_by_state(self, state_code: str = None) -> pd.DataFrame:
         """
         Filter NETS records by state
@@ -101,7 +265,8 @@ class NETSLoader:
         initial_count = len(self.df)
         
         # Handle both exact match and prefix match (6-digit codes)
-        self.df['naics_6digit'] = self.df['naics_code'].astype(str).str[:6]
+        # naics_code is read as str, so no per-cell astype(str) is needed
+        self.df['naics_6digit'] = self.df['naics_code'].str[:6]
         self.df = self.df[self.df['naics_6digit'].isin(naics_codes)]
         
         self.logger.info(
@@ -145,9 +310,9 @@ class NETSLoader:
         if self.df is None:
             self.load_raw()
         
-        zip_codes = [str(z) for z in zip_codes]
+        zip_codes = frozenset(str(z) for z in zip_codes)
         initial_count = len(self.df)
-        self.df = self.df[self.df['zip_code'].astype(str).isin(zip_codes)]
+        self.df = self.df[self.df['zip_code'].isin(zip_codes)]
         self.logger.info(f"ZIP code filter: {initial_count} -> {len(self.df)} records")
         return self.df
     
@@ -165,23 +330,28 @@ class NETSLoader:
             self.load_raw()
         
         initial_count = len(self.df)
+        self.df = self.df[self._active_mask(self.df, year_threshold)]
+        
+        self.logger.info(f"Active filter: {initial_count} -> {len(self.df)} records")
+        return self.df
+    
+    @staticmethod
+    def _active_mask(df: pd.DataFrame, year_threshold: int = 2015) -> pd.Series:
+        """Boolean mask of rows that pass the active-establishment filter"""
+        # Build one mask so the frame is indexed once
+        mask = pd.Series(True, index=df.index)
         
         # Remove records with year_closed in recent period (within 3 years)
-        if 'year_closed' in self.df.columns:
-            self.df = self.df[
-                (self.df['year_closed'].isna()) | 
-                (self.df['year_closed'] < 2023)
-            ]
+        if 'year_closed' in df.columns:
+            year_closed = df['year_closed']
+            mask &= year_closed.isna() | (year_closed < 2023)
         
         # Optional: Filter by establishment year
-        if 'year_established' in self.df.columns:
-            self.df = self.df[
-                (self.df['year_established'].isna()) |
-                (self.df['year_established'] >= year_threshold)
-            ]
+        if 'year_established' in df.columns:
+            year_established = df['year_established']
+            mask &= year_established.isna() | (year_established >= year_threshold)
         
-        self.logger.info(f"Active filter: {initial_count} -> {len(self.df)} records")
-        return self.df
+        return mask
     
     def get_geopandas_gdf(self, crs: str = "EPSG:4326") -> gpd.GeoDataFrame:
         """
@@ -267,6 +437,11 @@ class NETSLoader:
 class NETSValidator:
     """Validate NETS data quality and consistency"""
     
+    REQUIRED_COLUMNS = [
+        'duns_id', 'company_name', 'latitude', 'longitude',
+        'naics_code', 'zip_code', 'state'
+    ]
+    
     @staticmethod
     def check_required_columns(df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
@@ -278,13 +453,54 @@ class NETSValidator:
         Returns:
             Tuple of (is_valid, missing_columns)
         """
-        required = [
-            'duns_id', 'company_name', 'latitude', 'longitude',
-            'naics_code', 'zip_code', 'state'
-        ]
-        missing = [col for col in required if col not in df.columns]
+        missing = [col for col in NETSValidator.REQUIRED_COLUMNS if col not in df.columns]
         return len(missing) == 0, missing
     
+    @staticmethod
+    def check_parquet_output(path: Union[str, Path]) -> dict:
+        """
+        Validate an exported Parquet file or partitioned dataset
+        
+        Only the schema and row-group footers are read, so the check costs
+        O(metadata) rather than a full decompress and decode of the data.
+        
+        Args:
+            path: Parquet file, or hive-partitioned dataset directory
+            
+        Returns:
+            Dictionary with row count, missing required columns and
+            null counts of the required columns (None if stats are absent)
+        """
+        path = Path(path)
+        dataset = ds.dataset(path, format='parquet', partitioning='hive' if path.is_dir() else None)
+        columns = set(dataset.schema.names)
+        missing = [col for col in NETSValidator.REQUIRED_COLUMNS if col not in columns]
+        
+        total = 0
+        null_counts = {}
+        for fragment in dataset.get_fragments():
+            metadata = fragment.metadata
+            total += metadata.num_rows
+            file_columns = metadata.schema.names
+            for col in NETSValidator.REQUIRED_COLUMNS:
+                if col not in file_columns:
+                    # Partition keys live in the directory name, never null
+                    null_counts.setdefault(col, 0)
+                    continue
+                col_idx = file_columns.index(col)
+                for rg in range(metadata.num_row_groups):
+                    stats = metadata.row_group(rg).column(col_idx).statistics
+                    if stats is None or not stats.has_null_count or null_counts.get(col, 0) is None:
+                        null_counts[col] = None
+                    else:
+                        null_counts[col] = null_counts.get(col, 0) + stats.null_count
+        
+        return {
+            "total": total,
+            "missing_columns": missing,
+            "null_counts": {col: n for col, n in null_counts.items() if col not in missing}
+        }
+    
     @staticmethod
     def check_coordinates(df: pd.DataFrame) -> dict:
         """
@@ -6,11 +6,16 @@ End-to-end data processing: load NETS -> enrich with multi-source data -> output
 import pandas as pd
 import geopandas as gpd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 import logging
 from typing import Optional, Dict, List
 import json
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,15 @@ from src.data.nets_loader import NETSLoader, NETSValidator
 from src.models.bayesian_employee_estimator import EmployeeEstimator
 from src.models.survival_detector import SurvivalDetector
 from src.utils.logger import setup_logger
+from src.utils.cache import CACHE_DIR
+
+# Repetitive text columns stored dictionary-encoded in the Parquet output
+PARQUET_CATEGORICAL_COLUMNS = [
+    'naics_code', 'naics_6digit', 'naics_title', 'sic_code',
+    'zip_code', 'state', 'city',
+    'employees_estimation_method', 'employees_confidence', 'employees_primary_signal',
+    'is_active_confidence', 'survival_primary_indicator'
+]
 
 
 class NETSDataPipeline:
@@ -35,7 +49,12 @@ class NETSDataPipeline:
         self,
         nets_csv_path: str,
         output_parquet_path: str = DEFAULT_PARQUET_OUTPUT,
-        target_naics_codes: List[str] = None
+        target_naics_codes: List[str] = None,
+        fast_io: bool = False,
+        use_cache: bool = False,
+        rebuild_cache: bool = False,
+        chunksize: Optional[int] = None,
+        n_jobs: int = 1
     ):
         """
         Initialize pipeline
@@ -44,24 +63,35 @@ class NETSDataPipeline:
             nets_csv_path: Path to NETS CSV file
             output_parquet_path: Output Parquet file path
             target_naics_codes: NAICS codes to focus on (default: ['722513', '446110'])
+            fast_io: Read the NETS CSV with the PyArrow engine
+            use_cache: Reuse the filtered records from a Parquet cache in data/cache
+            rebuild_cache: Ignore an existing cache entry and rewrite it
+            chunksize: Stream the CSV in chunks of this many rows, filtering as it reads
+            n_jobs: Worker processes for the per-record model phases (-1 = all cores)
         """
         self.nets_csv_path = nets_csv_path
         self.output_parquet = output_parquet_path
         self.target_naics = target_naics_codes or ['722513', '446110']
+        self.use_cache = use_cache
+        self.rebuild_cache = rebuild_cache
+        self.chunksize = chunksize
+        self.n_jobs = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
         self.logger = setup_logger("NETSPipeline")
         
         # Initialize components
-        self.nets_loader = NETSLoader(nets_csv_path)
+        self.nets_loader = NETSLoader(nets_csv_path, fast_io=fast_io)
         self.employee_estimator = EmployeeEstimator(EMPLOYEE_ESTIMATION_BASELINES)
         self.survival_detector = SurvivalDetector()
         
         self.df = None  # Working DataFrame
         self.gdf = None  # GeoDataFrame for spatial operations
+        self.output_size_bytes = None  # Bytes written by the last export_parquet
     
     def load_and_filter(
         self,
         filter_by_zip: bool = True,
-        filter_active_only: bool = True
+        filter_active_only: bool = True,
+        max_records: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Load NETS data and apply geographic + industry filters
@@ -69,32 +99,90 @@ class NETSDataPipeline:
         Args:
             filter_by_zip: Apply Minneapolis ZIP code filter
             filter_active_only: Filter to likely active establishments
+            max_records: Keep only the first this many matching records in
+                file order and stop reading there (streams the CSV; for quick
+                sample runs). This is a head sample, not a random one.
             
         Returns:
             Filtered DataFrame
         """
-        self.logger.info("Loading NETS data...")
-        self.df = self.nets_loader.load_raw()
-        
-        self.logger.info(f"Initial records: {len(self.df)}")
+        cache_path = self._filtered_cache_path(filter_by_zip, filter_active_only, max_records)
+        if self.use_cache and not self.rebuild_cache and cache_path.exists():
+            self.logger.info(f"Loading filtered records from cache: {cache_path}")
+            self.df = pd.read_parquet(cache_path, engine='pyarrow')
+            self.nets_loader.df = self.df
+            self.logger.info(f"After filtering: {len(self.df)} records")
+            return self.df
         
-        # Industry filter
-        self.logger.info(f"Filtering to NAICS codes: {self.target_naics}")
-        self.df = self.nets_loader.filter_by_naics_codes(self.target_naics)
+        self.logger.info("Loading NETS data...")
+        if self.chunksize or max_records:
+            # Every filter is applied per chunk while streaming
+            self.df = self.nets_loader.load_filtered_chunks(
+                self.target_naics,
+                zip_codes=TARGET_ZIP_CODES if filter_by_zip else None,
+                chunksize=self.chunksize or 10 * max_records,
+                max_records=max_records,
+                active_only=filter_active_only
+            )
+        else:
+            self.df = self.nets_loader.load_raw()
+            self.logger.info(f"Initial records: {len(self.df)}")
+            
+            # Industry filter
+            self.logger.info(f"Filtering to NAICS codes: {self.target_naics}")
+            self.df = self.nets_loader.filter_by_naics_codes(self.target_naics)
+            
+            # Geographic filter
+            if filter_by_zip:
+                self.logger.info(f"Filtering to Minneapolis ZIP codes")
+                self.df = self.nets_loader.filter_by_zip_codes(TARGET_ZIP_CODES)
+            
+            # Active filter
+            if filter_active_only:
+                self.logger.info("Filtering to likely active establishments")
+                self.df = self.nets_loader.filter_active_only()
         
-        # Geographic filter
-        if filter_by_zip:
-            self.logger.info(f"Filtering to Minneapolis ZIP codes")
-            self.df = self.nets_loader.filter_by_zip_codes(TARGET_ZIP_CODES)
+        self.logger.info(f"After filtering: {len(self.df)} records")
         
-        # Active filter
-        if filter_active_only:
-            self.logger.info("Filtering to likely active establishments")
-            self.df = self.nets_loader.filter_active_only()
+        if self.use_cache:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self.df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+                self.logger.info(f"Cached filtered records: {cache_path}")
+            except Exception as e:
+                self.logger.warning(f"Could not write filter cache {cache_path}: {e}")
         
-        self.logger.info(f"After filtering: {len(self.df)} records")
         return self.df
     
+    def _filtered_cache_path(
+        self,
+        filter_by_zip: bool,
+        filter_active_only: bool,
+        max_records: Optional[int] = None
+    ) -> Path:
+        """
+        Cache file for the filtered NETS subset
+        
+        The key covers the input file (path, size, mtime) and every filter
+        setting, so editing the CSV or changing filters starts a new entry.
+        """
+        csv_path = Path(self.nets_csv_path)
+        try:
+            stat = csv_path.stat()
+            file_sig = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            file_sig = "missing"
+        key_parts = [
+            str(csv_path.resolve()),
+            file_sig,
+            ",".join(sorted(self.target_naics)),
+            ",".join(sorted(TARGET_ZIP_CODES)) if filter_by_zip else "all-zips",
+            f"active={filter_active_only}",
+            f"max_records={max_records}",
+        ]
+        key = hashlib.md5("|".join(key_parts).encode("utf-8")).hexdigest()
+        return CACHE_DIR / f"nets_filtered_{key}.parquet"
+    
     def create_geodataframe(self, crs: str = "EPSG:4326") -> gpd.GeoDataFrame:
         """
         Convert to GeoDataFrame for spatial operations
@@ -210,6 +298,36 @@ class NETSDataPipeline:
         self.logger.info(f"Enrichment complete: {len(self.df)} records")
         return self.df
     
+    def _run_batch(self, process_batch, df: pd.DataFrame, *args) -> pd.DataFrame:
+        """
+        Run a row-independent process_batch over df, split across worker processes
+        
+        Each model's process_batch returns its input with a fresh RangeIndex
+        plus result columns, so concatenating partitions in order gives the
+        same frame as a single call.
+        
+        Args:
+            process_batch: Bound process_batch method of a model
+            df: Records to process
+            *args: Extra positional arguments for process_batch
+            
+        Returns:
+            DataFrame returned by process_batch
+        """
+        n_parts = min(self.n_jobs, len(df))
+        if n_parts <= 1:
+            return process_batch(df, *args)
+        
+        bounds = np.linspace(0, len(df), n_parts + 1, dtype=int)
+        parts = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        self.logger.info(f"Processing {len(df)} records in {n_parts} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=n_parts) as executor:
+            futures = [executor.submit(process_batch, part, *args) for part in parts]
+            results = [future.result() for future in futures]
+        
+        return pd.concat(results, ignore_index=True)
+    
     def estimate_employees(self) -> pd.DataFrame:
         """
         Run employee estimation for all records
@@ -231,7 +349,7 @@ class NETSDataPipeline:
             
             # Process batch
             subset = self.df[mask].reset_index(drop=True)
-            enriched = self.employee_estimator.process_batch(subset, naics_code)
+            enriched = self._run_batch(self.employee_estimator.process_batch, subset, naics_code)
             
             # Merge results back
             self.df.loc[mask, enriched.columns[len(subset.columns):]] = enriched.iloc[:, len(subset.columns):].values
@@ -248,7 +366,7 @@ class NETSDataPipeline:
         """
         self.logger.info("Detecting business survival status...")
         
-        enriched = self.survival_detector.process_batch(self.df)
+        enriched = self._run_batch(self.survival_detector.process_batch, self.df)
         
         # Merge results
         survival_cols = [col for col in enriched.columns if 'survival' in col or 'is_active' in col]
@@ -272,52 +390,62 @@ class NETSDataPipeline:
         """
         self.logger.info("Calculating data quality scores...")
         
-        scores = []
+        df = self.df
+        n = len(df)
         
-        for _, row in self.df.iterrows():
-            # Completeness (20%): ratio of non-null fields
-            total_fields = len(row)
-            non_null = row.notna().sum()
-            completeness = (non_null / total_fields) * 20
-            
-            # Source diversity (20%): count of different data sources
-            sources_count = 0
-            if pd.notna(row.get('linkedin_headcount')):
-                sources_count += 1
-            if pd.notna(row.get('review_count_3m')):
-                sources_count += 1
-            if pd.notna(row.get('job_postings_6m')):
-                sources_count += 1
-            diversity_score = min(sources_count * 5, 20)
-            
-            # Signal confidence (30%): average confidence from models
-            confidence_map = {'high': 30, 'medium': 20, 'low': 10}
-            emp_conf = confidence_map.get(row.get('employees_confidence'), 10)
-            surv_conf = confidence_map.get(row.get('is_active_confidence'), 10)
-            signal_conf = (emp_conf + surv_conf) / 2
-            
-            # Estimate certainty (30%): CI width inversely related
-            ci_width_score = 30  # Default
-            if pd.notna(row.get('employees_ci_upper')) and pd.notna(row.get('employees_ci_lower')):
-                estimate = row.get('employees_optimized', 1)
-                if estimate > 0:
-                    ci_width = row['employees_ci_upper'] - row['employees_ci_lower']
-                    width_ratio = ci_width / estimate
-                    ci_width_score = max(10, 30 - (width_ratio * 15))  # Narrower CI = higher score
-            
-            total_score = completeness + diversity_score + signal_conf + ci_width_score
-            scores.append(min(total_score, 100))
+        def numeric(col: str) -> np.ndarray:
+            return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+        
+        # Completeness (20%): ratio of non-null fields
+        total_fields = len(df.columns)
+        completeness = df.notna().sum(axis=1).to_numpy() / total_fields * 20
+        
+        # Source diversity (20%): count of different data sources
+        sources_count = np.zeros(n)
+        for col in ('linkedin_headcount', 'review_count_3m', 'job_postings_6m'):
+            if col in df.columns:
+                sources_count += df[col].notna().to_numpy()
+        diversity_score = np.minimum(sources_count * 5, 20)
+        
+        # Signal confidence (30%): average confidence from models
+        confidence_map = {'high': 30, 'medium': 20, 'low': 10}
+        
+        def confidence_points(col: str) -> np.ndarray:
+            if col not in df.columns:
+                return np.full(n, 10.0)
+            return df[col].astype(object).map(confidence_map).fillna(10).to_numpy(dtype=float)
+        
+        signal_conf = (confidence_points('employees_confidence') + confidence_points('is_active_confidence')) / 2
+        
+        # Estimate certainty (30%): CI width inversely related
+        ci_width_score = np.full(n, 30.0)  # Default
+        if 'employees_ci_upper' in df.columns and 'employees_ci_lower' in df.columns:
+            upper = numeric('employees_ci_upper')
+            lower = numeric('employees_ci_lower')
+            estimate = numeric('employees_optimized') if 'employees_optimized' in df.columns else np.ones(n)
+            has_ci = ~np.isnan(upper) & ~np.isnan(lower) & (estimate > 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                width_ratio = (upper - lower) / estimate
+            # Narrower CI = higher score
+            ci_width_score = np.where(has_ci, np.maximum(10, 30 - (width_ratio * 15)), 30.0)
+        
+        total_score = completeness + diversity_score + signal_conf + ci_width_score
+        scores = np.minimum(total_score, 100)
         
         self.df['data_quality_score'] = scores
         self.logger.info(f"Quality scores calculated: mean={np.mean(scores):.1f}")
         
         return self.df
     
-    def prepare_parquet_output(self) -> pd.DataFrame:
+    def prepare_parquet_output(self, schema_only: bool = False) -> pd.DataFrame:
         """
         Prepare DataFrame for Parquet export
         Select and order columns per schema specification
         
+        Args:
+            schema_only: Drop columns that are not in PARQUET_OUTPUT_SCHEMA
+                (model diagnostics, raw NETS extras) to shrink the export
+        
         Returns:
             DataFrame with columns in PARQUET_OUTPUT_SCHEMA order
         """
@@ -326,9 +454,12 @@ class NETSDataPipeline:
         # Start with available columns from schema
         available_cols = [col for col in PARQUET_OUTPUT_SCHEMA if col in self.df.columns]
         
-        # Add any columns not in schema that are valuable
-        existing_cols = set(self.df.columns)
-        extra_cols = list(existing_cols - set(available_cols))
+        # Add any columns not in schema that are valuable, in frame order
+        if schema_only:
+            extra_cols = []
+        else:
+            schema_cols = set(available_cols)
+            extra_cols = [col for col in self.df.columns if col not in schema_cols]
         
         output_cols = available_cols + extra_cols
         
@@ -345,34 +476,78 @@ class NETSDataPipeline:
     def export_parquet(
         self,
         df: pd.DataFrame,
-        compression: str = 'snappy',
-        index: bool = False
+        compression: str = 'zstd',
+        index: bool = False,
+        compression_level: Optional[int] = 3,
+        row_group_size: int = 100_000,
+        partition_cols: Optional[List[str]] = None
     ) -> Path:
         """
         Export DataFrame to Parquet format
         
+        Low-cardinality text columns are written as categoricals so they are
+        stored dictionary-encoded and read back as categories.
+        
         Args:
             df: DataFrame to export
-            compression: Compression algorithm ('snappy', 'gzip', None)
+            compression: Compression algorithm ('zstd', 'snappy', 'gzip', None)
             index: Include index in output
+            compression_level: Codec level (zstd/gzip only)
+            row_group_size: Rows per Parquet row group
+            partition_cols: Write a hive-partitioned dataset directory (output
+                path without the .parquet suffix) split on these columns,
+                e.g. ['naics_code'], so readers can load one partition
             
         Returns:
-            Path to exported file
+            Path to exported file (or dataset directory when partitioned)
         """
         output_path = Path(self.output_parquet)
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        if partition_cols:
+            output_path = output_path.with_suffix('')
+            write_options_extra = {
+                'partition_cols': partition_cols,
+                'existing_data_behavior': 'delete_matching'
+            }
+        else:
+            write_options_extra = {}
         
         self.logger.info(f"Exporting to Parquet: {output_path}")
         
+        categorical_cols = {
+            col: 'category' for col in PARQUET_CATEGORICAL_COLUMNS if col in df.columns
+        }
+        if categorical_cols:
+            df = df.astype(categorical_cols)
+        
+        write_options = {
+            'row_group_size': row_group_size,
+            'use_dictionary': True,
+            **write_options_extra
+        }
+        if compression in ('zstd', 'gzip', 'brotli') and compression_level is not None:
+            write_options['compression_level'] = compression_level
+        
         try:
-            df.to_parquet(
-                output_path,
-                compression=compression,
-                index=index,
-                engine='pyarrow'
-            )
-            
-            file_size_mb = output_path.stat().st_size / (1024 * 1024)
+            # Take the size from the writer rather than stat'ing the output
+            if partition_cols:
+                written = []
+                df.to_parquet(
+                    output_path,
+                    compression=compression,
+                    index=index,
+                    engine='pyarrow',
+                    file_visitor=written.append,
+                    **write_options
+                )
+                size_bytes = sum(f.size for f in written)
+            else:
+                table = pa.Table.from_pandas(df, preserve_index=index)
+                with pa.OSFile(str(output_path), 'wb') as sink:
+                    pq.write_table(table, sink, compression=compression, **write_options)
+                    size_bytes = sink.tell()
+            self.output_size_bytes = size_bytes
+            file_size_mb = size_bytes / (1024 * 1024)
             self.logger.info(f"Parquet export complete: {file_size_mb:.1f} MB")
             
             return output_path
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 from dataclasses import dataclass
 import requests
+from shapely.geometry import MultiPolygon, Polygon, box
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,19 @@ class CityBoundary:
         """Return bounds as (min_lon, min_lat, max_lon, max_lat)"""
         return (self.min_lon, self.min_lat, self.max_lon, self.max_lat)
     
+    def to_shape(self):
+        """
+        Return the boundary as a shapely geometry in (lon, lat) order.
+        
+        Falls back to the bounding box when no polygon was fetched.
+        """
+        if not self.polygon:
+            return box(self.min_lon, self.min_lat, self.max_lon, self.max_lat)
+        # GeoJSON MultiPolygon nests one level deeper than Polygon / Esri rings
+        if isinstance(self.polygon[0][0][0], list):
+            return MultiPolygon([Polygon(rings[0], rings[1:]) for rings in self.polygon])
+        return Polygon(self.polygon[0], self.polygon[1:])
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         return {
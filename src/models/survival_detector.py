@@ -214,7 +214,8 @@ class SurvivalDetector:
         facade_visible: Optional[bool] = None,
         signage_visible: Optional[bool] = None,
         lighting_visible: Optional[bool] = None,
-        latest_review_sentiment: Optional[str] = None
+        latest_review_sentiment: Optional[str] = None,
+        review_recency: Optional[Tuple[Optional[int], bool]] = None
     ) -> Dict:
         """
         Score business survival probability using multi-signal fusion
@@ -229,6 +230,7 @@ class SurvivalDetector:
             signage_visible: Street view signage detection
             lighting_visible: Street view lighting detection
             latest_review_sentiment: Sentiment of latest review
+            review_recency: Precomputed evaluate_review_recency result (optional)
             
         Returns:
             Dictionary with survival probability and supporting metrics
@@ -240,7 +242,9 @@ class SurvivalDetector:
         signal_weights = []
         
         # Signal 1: Review recency (weight: 0.35)
-        days_since, is_recent = self.evaluate_review_recency(last_review_date)
+        if review_recency is None:
+            review_recency = self.evaluate_review_recency(last_review_date)
+        days_since, is_recent = review_recency
         if days_since is not None:
             signals_used.append('review_recency')
             if days_since <= 30:
@@ -431,20 +435,35 @@ class SurvivalDetector:
         Returns:
             DataFrame with added survival probability columns
         """
+        n = len(df)
+        signal_columns = [
+            'last_review_date', 'review_count_3m', 'review_count_6_12m',
+            'job_postings_6m', 'job_postings_peak', 'facade_visible',
+            'signage_visible', 'lighting_visible', 'latest_review_sentiment'
+        ]
+        # Pull each column once instead of materializing a Series per row
+        columns = {
+            col: df[col].tolist() if col in df.columns else [None] * n
+            for col in signal_columns
+        }
+        duns_ids = df['duns_id'].tolist() if 'duns_id' in df.columns else ['unknown'] * n
+        names = df['company_name'].tolist() if 'company_name' in df.columns else ['unknown'] * n
+        
+        # Review dates repeat heavily; parse each distinct value once
+        recency_by_date = {}
+        for value in columns['last_review_date']:
+            key = repr(value)
+            if key not in recency_by_date:
+                recency_by_date[key] = self.evaluate_review_recency(value)
+        
         survival_list = []
         
-        for _, row in df.iterrows():
+        for i in range(n):
+            signals = {col: values[i] for col, values in columns.items()}
             estimate = self.estimate(
-                record=row.to_dict(),
-                last_review_date=row.get('last_review_date'),
-                review_count_3m=row.get('review_count_3m'),
-                review_count_6_12m=row.get('review_count_6_12m'),
-                job_postings_6m=row.get('job_postings_6m'),
-                job_postings_peak=row.get('job_postings_peak'),
-                facade_visible=row.get('facade_visible'),
-                signage_visible=row.get('signage_visible'),
-                lighting_visible=row.get('lighting_visible'),
-                latest_review_sentiment=row.get('latest_review_sentiment')
+                record={'duns_id': duns_ids[i], 'company_name': names[i]},
+                review_recency=recency_by_date[repr(signals['last_review_date'])],
+                **signals
             )
             survival_list.append(estimate)
         
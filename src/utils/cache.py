@@ -0,0 +1,182 @@
+"""
+On-disk caches for external API responses
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cache directory for API responses
+# Path: src/utils/cache.py -> parent.parent.parent = project root
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+
+# API responses older than this are refetched
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from request parameters
+
+    Args:
+        *parts: JSON-serializable values (endpoint name, params dict, ...)
+
+    Returns:
+        32-character blake2b hex digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class JSONFileCache:
+    """
+    Dictionary cache persisted to a single JSON file.
+
+    The file is read once on construction and rewritten whenever a new
+    entry is stored, so it suits small lookup tables that rarely change
+    (e.g. ZIP code centroids). Safe to share between threads.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize cache backed by a JSON file
+
+        Args:
+            path: JSON file location (created on first write)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        """Read cached entries from disk, ignoring a missing or corrupt file"""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Cache file unreadable, starting empty: {self.path} ({e})")
+            return {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return cached value for key, or default"""
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value and persist the cache file"""
+        with self._lock:
+            self._data[key] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to write cache file {self.path}: {e}")
+
+
+class DiskCache:
+    """
+    Key/value cache with one JSON file per entry and a per-entry TTL.
+
+    Suited to API responses: entries are written independently, so a large
+    cache never has to be rewritten as a whole, and expired entries are
+    dropped when read. Keys should come from make_cache_key.
+    """
+
+    def __init__(self, directory: Path, ttl: Optional[float] = DEFAULT_TTL_SECONDS, enabled: bool = True):
+        """
+        Initialize cache directory
+
+        Args:
+            directory: Folder holding cache entries (created on first write)
+            ttl: Default lifetime in seconds (None = never expires)
+            enabled: When False, get() always misses and set() is a no-op
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts of get() since the cache was created"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _path(self, key: str) -> Path:
+        # Shard by key prefix to keep directories small
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return cached value for key, or default if missing or expired"""
+        if not self.enabled:
+            return default
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            self.misses += 1
+            return default
+
+        expires = entry.get("expires")
+        if expires is not None and expires < time.time():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry.get("value", default)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Lifetime in seconds (default: cache ttl)
+        """
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        entry = {
+            "expires": time.time() + ttl if ttl is not None else None,
+            "value": value,
+        }
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
@@ -6,10 +6,16 @@ import re
 import requests
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
-import hashlib
 import json
 from pathlib import Path
 
+# orjson parses large API payloads several times faster; optional (pip install orjson).
+# Both accept str or bytes and raise ValueError subclasses on bad input.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 def clean_url(url: str) -> str:
     """Clean and normalize URL"""
@@ -196,12 +202,6 @@ def calculate_confidence_score(indicators: Dict) -> str:
         return 'Low'
 
 
-def generate_cache_key(*args) -> str:
-    """Generate cache key from arguments"""
-    key_string = "_".join(str(arg) for arg in args)
-    return hashlib.md5(key_string.encode()).hexdigest()
-
-
 def save_json(data: Dict, filepath: Path):
     """Save dict to JSON file"""
     filepath.parent.mkdir(parents=True, exist_ok=True)
@@ -2,20 +2,100 @@
 Logging configuration for NETS Enhancement System
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
+# One queue and one listener thread for every queued logger in the process,
+# so records from different loggers are written in the order they were logged
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+# Logger names whose records also go to the log file
+_file_loggers = set()
 
-def setup_logger(name: str = "NETS-Enhancement", level: str = None, log_file: bool = True) -> logging.Logger:
+
+def _console_handler() -> logging.Handler:
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(logging.Formatter(
+        '%(asctime)s [%(levelname)s] %(message)s',
+        datefmt='%H:%M:%S'
+    ))
+    return console_handler
+
+
+def _file_handler() -> logging.Handler:
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d")
+    log_path = log_dir / f"ai_bdd_{timestamp}.log"
+
+    file_handler = logging.FileHandler(log_path, encoding='utf-8', delay=True)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    return file_handler
+
+
+def _writes_file(record: logging.LogRecord) -> bool:
+    """File-handler filter: only loggers set up with log_file=True"""
+    return any(record.name == name or record.name.startswith(name + '.') for name in _file_loggers)
+
+
+def _ensure_listener() -> None:
+    """Start the shared listener thread on first use (stopped at exit)"""
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            file_handler = _file_handler()
+            file_handler.addFilter(_writes_file)
+            listener = logging.handlers.QueueListener(
+                _log_queue, _console_handler(), file_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _listener = listener
+
+
+class _SharedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that starts the shared listener with its first record"""
+
+    def enqueue(self, record):
+        _ensure_listener()
+        super().enqueue(record)
+
+
+def setup_logger(
+    name: str = "NETS-Enhancement",
+    level: str = None,
+    log_file: bool = True,
+    queued: bool = True
+) -> logging.Logger:
     """
     Setup centralized logger
     
+    With queued=True the logger only enqueues records; one process-wide
+    QueueListener thread formats them and does the console/file writes, so
+    logging calls in hot pipeline phases never block on I/O. The thread
+    starts with the first record logged (not at import) and is stopped,
+    with the queue drained, at interpreter exit.
+    
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         log_file: Whether to write to file
+        queued: Hand records to the background thread instead of writing inline
         
     Returns:
         Configured logger
@@ -31,32 +111,14 @@ def setup_logger(name: str = "NETS-Enhancement", level: str = None, log_file: bo
     if logger.handlers:
         return logger
     
-    # Console handler with colors
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter(
-        '%(asctime)s [%(levelname)s] %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d")
-        log_path = log_dir / f"ai_bdd_{timestamp}.log"
-        
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+    if queued:
+        if log_file:
+            _file_loggers.add(name)
+        logger.addHandler(_SharedQueueHandler(_log_queue))
+    else:
+        logger.addHandler(_console_handler())
+        if log_file:
+            logger.addHandler(_file_handler())
     
     return logger
 
@@ -0,0 +1,61 @@
+"""
+Request rate limiting for async API clients
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket shared by the coroutines of one event loop.
+
+    Allows bursts of up to `rate` requests, then at most `rate` per `period`
+    seconds on average. Waiters are served in arrival order, so many tasks
+    finishing at once queue up instead of hitting the API together.
+
+    Usage:
+        limiter = AsyncRateLimiter(50, 1.0)
+        async with limiter:
+            await client.get(...)
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        """
+        Initialize a full bucket
+
+        Args:
+            rate: Requests allowed per period (also the burst size)
+            period: Period length in seconds
+        """
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Wait until a request may be sent, then consume its tokens
+
+        Args:
+            amount: Tokens the request costs (e.g. its LLM token count when
+                the bucket meters tokens per minute); capped at the capacity
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.fill_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False